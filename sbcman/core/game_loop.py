@@ -19,6 +19,19 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Event types the states react to; everything else (mouse motion, joystick
+# axis noise, window events) is dropped before it reaches the states.
+INPUT_EVENT_TYPES = frozenset({
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYHATMOTION,
+})
+
+# Frame rate while another process has the display; the loop only needs
+# to notice the game exiting, not to redraw.
+BACKGROUND_FPS = 5
+
 
 class GameLoop:
     """
@@ -53,11 +66,13 @@ class GameLoop:
         logger.info(f"Game loop started (target FPS: {target_fps})")
         
         while self.running:
-            # Calculate delta time
-            dt = clock.tick(target_fps) / 1000.0  # Convert to seconds
+            # Calculate delta time, idling while the display is released
+            fps = target_fps if state_manager.owns_display() else BACKGROUND_FPS
+            dt = clock.tick(fps) / 1000.0  # Convert to seconds
             
-            # Handle events
-            events = pygame.event.get()
+            # Handle events. The queue is drained in full so it never fills
+            # up, but only input events are passed on.
+            events = [event for event in pygame.event.get() if event.type in INPUT_EVENT_TYPES]
             for event in events:
                 if event.type == pygame.QUIT:
                     logger.info("Quit event received")
@@ -73,10 +88,11 @@ class GameLoop:
             # Update state logic
             state_manager.update(dt)
             
-            # Render
-            state_manager.render(state_manager.screen)
-            
-            # Flip display
-            pygame.display.flip()
+            # Render, unless another process has the display
+            if state_manager.owns_display():
+                state_manager.render(state_manager.screen)
+                
+                # Flip display
+                pygame.display.flip()
         
         logger.info("Game loop ended")
\ No newline at end of file
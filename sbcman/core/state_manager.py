@@ -186,6 +186,15 @@ class StateManager:
         if self.current_state:
             self.current_state.update(dt)
 
+    def owns_display(self) -> bool:
+        """
+        Check whether the current state lets the launcher draw to the display.
+
+        Returns:
+            bool: False while another process has the display
+        """
+        return self.current_state is None or self.current_state.owns_display()
+
     def handle_events(self, events: List[pygame.event.Event]) -> None:
         """
         Route pygame events to current state.
@@ -23,10 +23,8 @@ class AppPaths:
         self._base_dir = base_dir
         self._home_dir = home_dir
 
-        tmpdir = tempfile.mkdtemp()
-        self._temp_dir = pathlib.Path(tmpdir) / "game_manager"
-        self._temp_dir.mkdir(exist_ok=True)
-        #self._temp_dir.chmod(0x700)
+        # Created on first use; most instances never need it
+        self._temp_dir: pathlib.Path | None = None
 
     # TODO: Should probably not give away this one
     @property
@@ -39,6 +37,11 @@ class AppPaths:
     
     @property
     def temp_dir(self) -> pathlib.Path:
+        if self._temp_dir is None:
+            tmpdir = tempfile.mkdtemp()
+            self._temp_dir = pathlib.Path(tmpdir) / "game_manager"
+            self._temp_dir.mkdir(exist_ok=True)
+            #self._temp_dir.chmod(0x700)
         return self._temp_dir
     
     @property
@@ -7,6 +7,7 @@ Uses threading to keep UI responsive during downloads.
 """
 
 import logging
+import shutil
 import threading
 from pathlib import Path
 from typing import Optional, Callable
@@ -20,6 +21,10 @@ logger = logging.getLogger(__name__)
 
 ProgressCallback = Callable[[float], None]
 
+# Required free space as a multiple of the archive size, leaving headroom
+# for the extracted files next to the downloaded archive.
+DISK_SPACE_FACTOR = 2
+
 
 class DownloadObserver:
     """ Observer interface for download progress. """
@@ -37,6 +42,10 @@ class DownloadObserver:
         pass
 
 
+# Shared no-op observer so callback sites need no per-call None checks
+_NULL_OBSERVER = DownloadObserver()
+
+
 class DownloadManager:
     """
     Download manager with observer pattern.
@@ -73,16 +82,17 @@ class DownloadManager:
 
     def download_game(self, game: game_pb2.Game, observer: Optional[DownloadObserver] = None) -> None:
         """Start downloading a game in a separate thread."""
+        if observer is None:
+            observer = _NULL_OBSERVER
+
         if self.is_downloading:
             logger.warning("Download already in progress")
-            if observer:
-                observer.on_error("Download already in progress")
+            observer.on_error("Download already in progress")
             return
 
         if not game.download_url:
             logger.error(f"No download URL for game: {game.name}")
-            if observer:
-                observer.on_error("No download URL available")
+            observer.on_error("No download URL available")
             return
 
         # Start download thread
@@ -95,9 +105,37 @@ class DownloadManager:
         self.current_download.start()
         logger.info(f"Started download for game: {game.name}")
 
-    def _download_thread(self, game: game_pb2.Game, observer: Optional[DownloadObserver]) -> None:
+    def _check_disk_space(self, game: game_pb2.Game) -> Optional[str]:
+        """
+        Check that the downloads directory has room for the game.
+
+        Returns:
+            str: Error message if there is not enough space, None otherwise
+        """
+        total = self.network.get_file_size(game.download_url)
+        if not total:
+            return None
+
+        required = total * DISK_SPACE_FACTOR
+        try:
+            free = shutil.disk_usage(self.downloads_dir).free
+        except OSError as e:
+            logger.warning(f"Could not determine free disk space: {e}")
+            return None
+
+        if free < required:
+            return f"Insufficient disk space: {free} < {required}"
+        return None
+
+    def _download_thread(self, game: game_pb2.Game, observer: DownloadObserver) -> None:
         """Worker thread for downloading and extracting game."""
         try:
+            # Check free space up front rather than failing partway through;
+            # done here because the size lookup is a network request
+            space_error = self._check_disk_space(game)
+            if space_error:
+                raise Exception(space_error)
+
             dest_file = self._download_file(game, observer)
             install_path = self._install_game(dest_file, game, observer)
 
@@ -107,22 +145,20 @@ class DownloadManager:
             self._persist_if_available(game)
             dest_file.unlink()
 
-            if observer:
-                observer.on_complete(True, f"Successfully installed {game.name}")
+            observer.on_complete(True, f"Successfully installed {game.name}")
 
             logger.info(f"Download and installation complete: {game.name}")
 
         except Exception as e:
             logger.error(f"Download failed: {e}")
-            if observer:
-                observer.on_error(str(e))
-                observer.on_complete(False, str(e))
+            observer.on_error(str(e))
+            observer.on_complete(False, str(e))
 
         finally:
             self.is_downloading = False
             self.download_progress = 0.0
 
-    def _download_file(self, game: game_pb2.Game, observer: Optional[DownloadObserver]) -> Path:
+    def _download_file(self, game: game_pb2.Game, observer: DownloadObserver) -> Path:
         """Download the game file and return the destination path."""
         filename = Path(game.download_url).name
 
@@ -133,8 +169,7 @@ class DownloadManager:
             # Scale download progress to 0-60% range
             download_fraction = min(downloaded / total if total > 0 else 0, 1.0)
             self.download_progress = download_fraction * 0.6
-            if observer:
-                observer.on_progress(downloaded, total)
+            observer.on_progress(downloaded, total)
 
         success = self.network.download_file(
             game.download_url,
@@ -148,17 +183,16 @@ class DownloadManager:
         return dest_file
 
     def _install_game(self, archive_path: Path, game: game_pb2.Game, 
-                     observer: Optional[DownloadObserver]) -> Path:
+                     observer: DownloadObserver) -> Path:
         """Install the game from the downloaded archive."""
         # Create progress callback for installer (60-100% range)
         def install_progress_callback(progress: float) -> None:
             # progress is 0.0-1.0, scale to 60-100%
             self.download_progress = 0.6 + (progress * 0.4)
-            if observer:
-                # Convert to downloaded/total format for backward compatibility
-                total = 100
-                downloaded = int(self.download_progress * total)
-                observer.on_progress(downloaded, total)
+            # Convert to downloaded/total format for backward compatibility
+            total = 100
+            downloaded = int(self.download_progress * total)
+            observer.on_progress(downloaded, total)
         
         return self.game_installer.install_game(archive_path, game, install_progress_callback)
 
@@ -9,13 +9,18 @@ Provides pathlib-based file operations with error handling.
 Based on: docs/code/class_services_file_ops.txt
 """
 
+import errno
+import os
 import shutil
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for the user-space copy loop
+COPY_BUFSIZE = 1 << 20
+
 
 class FileOps:
     """
@@ -38,7 +43,7 @@ class FileOps:
         """
         try:
             path.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Ensured directory exists: {path}")
+            logger.debug("Ensured directory exists: %s", path)
             return True
         except Exception as e:
             logger.error(f"Failed to create directory {path}: {e}")
@@ -49,24 +54,188 @@ class FileOps:
         """
         Copy file from source to destination.
         
+        Like shutil.copy2, a directory destination receives a file of the
+        same name, and copying a file onto itself fails.
+        
         Args:
             src: Source file path
-            dst: Destination file path
+            dst: Destination file or directory path
             
         Returns:
             bool: True if copy succeeded
         """
         try:
+            dst = FileOps._copy_destination(src, dst)
+            
             # Ensure destination directory exists
             dst.parent.mkdir(parents=True, exist_ok=True)
             
-            shutil.copy2(src, dst)
+            FileOps._copy_data(src, dst)
+            shutil.copystat(src, dst)
             logger.info(f"Copied file: {src} -> {dst}")
             return True
         except Exception as e:
             logger.error(f"Failed to copy {src} to {dst}: {e}")
             return False
 
+    @staticmethod
+    def copy_many(pairs: Iterable[Tuple[Path, Path]]) -> bool:
+        """
+        Copy several files, creating each destination directory only once.
+        
+        Destinations are resolved as in copy_file.
+        
+        Args:
+            pairs: (source, destination) file or directory path pairs
+            
+        Returns:
+            bool: True if all copies succeeded
+        """
+        pairs = list(pairs)
+        try:
+            for parent in {dst.parent for _, dst in pairs}:
+                parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to create destination directories: {e}")
+            return False
+
+        success = True
+        for src, dst in pairs:
+            try:
+                dst = FileOps._copy_destination(src, dst)
+                FileOps._copy_data(src, dst)
+                shutil.copystat(src, dst)
+            except Exception as e:
+                logger.error(f"Failed to copy {src} to {dst}: {e}")
+                success = False
+
+        logger.info(f"Copied {len(pairs)} files")
+        return success
+
+    @staticmethod
+    def _copy_destination(src: Path, dst: Path) -> Path:
+        """
+        Resolve the file a copy writes to.
+        
+        Must run before the destination is opened for writing, which
+        truncates it.
+        
+        Args:
+            src: Source file path
+            dst: Destination file or directory path
+            
+        Returns:
+            Path: dst, or dst / src.name if dst is a directory
+            
+        Raises:
+            shutil.SameFileError: If src and the destination are the same file
+        """
+        if dst.is_dir():
+            dst = dst / src.name
+        if dst.exists() and os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src} and {dst} are the same file")
+        return dst
+
+    @staticmethod
+    def _copy_data(src: Path, dst: Path) -> None:
+        """
+        Copy file contents, keeping the data in the kernel where possible.
+        
+        Args:
+            src: Source file path
+            dst: Destination file path
+        """
+        with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+            if FileOps._copy_file_range(fsrc.fileno(), fdst.fileno()):
+                return
+            if FileOps._copy_sendfile(fsrc.fileno(), fdst.fileno()):
+                return
+            FileOps._copy_readinto(fsrc, fdst)
+
+    @staticmethod
+    def _copy_readinto(fsrc, fdst) -> None:
+        """
+        Copy between unbuffered file objects through one reused buffer.
+        
+        Args:
+            fsrc: Source file opened with buffering=0
+            fdst: Destination file opened with buffering=0
+        """
+        with memoryview(bytearray(COPY_BUFSIZE)) as mv:
+            while True:
+                n = fsrc.readinto(mv)
+                if not n:
+                    break
+                view = mv[:n]
+                while view:
+                    written = fdst.write(view)
+                    view = view[written:]
+
+    @staticmethod
+    def _copy_file_range(src_fd: int, dst_fd: int) -> bool:
+        """
+        Copy between file descriptors with os.copy_file_range.
+        
+        Lets the filesystem reflink the data or copy it server-side
+        (btrfs, XFS, NFS) instead of moving the bytes.
+        
+        Args:
+            src_fd: Source file descriptor
+            dst_fd: Destination file descriptor
+            
+        Returns:
+            bool: True if the data was copied, False if copy_file_range is
+            unavailable for these files and nothing was written
+        """
+        if not hasattr(os, "copy_file_range"):
+            return False
+
+        size = os.fstat(src_fd).st_size
+        copied = 0
+        while True:
+            try:
+                n = os.copy_file_range(src_fd, dst_fd, max(size - copied, COPY_BUFSIZE))
+            except OSError as e:
+                if copied == 0 and e.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                                               errno.ENOTSUP, errno.EBADF, errno.EPERM):
+                    return False
+                raise
+            if n == 0:
+                # Some filesystems (FUSE, overlayfs) report 0 right away for
+                # a non-empty file; fall back before anything was written
+                return copied > 0 or size == 0
+            copied += n
+
+    @staticmethod
+    def _copy_sendfile(src_fd: int, dst_fd: int) -> bool:
+        """
+        Copy between file descriptors with os.sendfile.
+        
+        Args:
+            src_fd: Source file descriptor
+            dst_fd: Destination file descriptor
+            
+        Returns:
+            bool: True if the data was copied, False if sendfile is
+            unavailable for these files and nothing was written
+        """
+        if not hasattr(os, "sendfile"):
+            return False
+
+        size = os.fstat(src_fd).st_size
+        offset = 0
+        while True:
+            try:
+                sent = os.sendfile(dst_fd, src_fd, offset, max(size - offset, COPY_BUFSIZE))
+            except OSError as e:
+                if offset == 0 and e.errno in (errno.EINVAL, errno.ENOTSUP, errno.ENOSYS):
+                    return False
+                raise
+            if sent == 0:
+                # Fall back if nothing was sent for a non-empty file
+                return offset > 0 or size == 0
+            offset += sent
+
     @staticmethod
     def move_file(src: Path, dst: Path) -> bool:
         """
@@ -102,13 +271,12 @@ class FileOps:
             bool: True if deletion succeeded
         """
         try:
-            if path.exists():
-                path.unlink()
-                logger.info(f"Deleted file: {path}")
-                return True
-            else:
-                logger.warning(f"File not found for deletion: {path}")
-                return False
+            path.unlink()
+            logger.info(f"Deleted file: {path}")
+            return True
+        except FileNotFoundError:
+            logger.warning(f"File not found for deletion: {path}")
+            return False
         except Exception as e:
             logger.error(f"Failed to delete {path}: {e}")
             return False
@@ -126,10 +294,6 @@ class FileOps:
             bool: True if deletion succeeded
         """
         try:
-            if not path.exists():
-                logger.warning(f"Directory not found for deletion: {path}")
-                return False
-            
             if recursive:
                 shutil.rmtree(path)
                 logger.info(f"Deleted directory recursively: {path}")
@@ -138,6 +302,9 @@ class FileOps:
                 logger.info(f"Deleted empty directory: {path}")
             
             return True
+        except FileNotFoundError:
+            logger.warning(f"Directory not found for deletion: {path}")
+            return False
         except Exception as e:
             logger.error(f"Failed to delete directory {path}: {e}")
             return False
@@ -156,7 +323,7 @@ class FileOps:
         """
         try:
             content = path.read_text(encoding=encoding)
-            logger.debug(f"Read text file: {path}")
+            logger.debug("Read text file: %s", path)
             return content
         except Exception as e:
             logger.error(f"Failed to read {path}: {e}")
@@ -180,7 +347,7 @@ class FileOps:
             path.parent.mkdir(parents=True, exist_ok=True)
             
             path.write_text(content, encoding=encoding)
-            logger.debug(f"Wrote text file: {path}")
+            logger.debug("Wrote text file: %s", path)
             return True
         except Exception as e:
             logger.error(f"Failed to write {path}: {e}")
@@ -46,6 +46,9 @@ class GameLibrary:
         self.local_games = self.load_games(self.local_games_file)
         self.games = self.local_games.copy()  # For test compatibility
 
+        # Set by add/remove/update so save_games only writes when needed
+        self._dirty = False
+
         self.game_list_url = config.get("games.game_list_url")
 
         if self.local_games:
@@ -62,18 +65,17 @@ class GameLibrary:
             List of Game objects loaded from the file, or
             an empty games file if it doesn't exist.
         """
-        if not games_file.exists():
-            logger.info("Games file not found, creating empty library")
-            return []
-
         try:
-            with open(games_file, "r") as f:
-                data = json.load(f)
+            # Single read of the raw bytes; json.loads detects the encoding
+            data = json.loads(games_file.read_bytes())
 
             games = [game_from_dict(game_data) for game_data in data]
             logger.info(f"Loaded {len(games)} games from {games_file}")
             return games
 
+        except FileNotFoundError:
+            logger.info("Games file not found, creating empty library")
+            return []
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in games file: {e}")
             return []
@@ -81,12 +83,15 @@ class GameLibrary:
             logger.error(f"Failed to load games: {e}")
             return []
 
-    def _save_games_to_file(self, games: list[game_pb2.Game], games_file: pathlib.Path) -> None:
+    def _save_games_to_file(self, games: list[game_pb2.Game], games_file: pathlib.Path) -> bool:
         """ Save games to JSON file.
 
         Args:
             games: List of Game objects to save.
             games_file: Path to the games JSON file.
+
+        Returns:
+            True if the file was written.
         """
         try:
             logger.info(f"Save list of games to {games_file}")
@@ -99,13 +104,19 @@ class GameLibrary:
                 json.dump(data, f, indent=2)
 
             logger.info(f"Saved {len(games)} games to {games_file}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to save games: {e}")
+            return False
     
     def save_games(self) -> None:
-        """Save current games to the default games file."""
-        self._save_games_to_file(self.local_games, self.local_games_file)
+        """Save current games to the default games file, if they changed since the last save."""
+        if not self._dirty:
+            logger.debug("Games unchanged, skipping save")
+            return
+        if self._save_games_to_file(self.local_games, self.local_games_file):
+            self._dirty = False
         
     def add_game(self, game: game_pb2.Game) -> None:
         """
@@ -122,6 +133,7 @@ class GameLibrary:
         
         self.local_games.append(game)
         self.games = self.local_games.copy()  # Keep games in sync
+        self._dirty = True
         logger.info(f"Added game: {game.name}")
 
     def remove_game(self, game_id: str) -> bool:
@@ -138,6 +150,7 @@ class GameLibrary:
             if game.id == game_id:
                 removed = self.local_games.pop(i)
                 self.games = self.local_games.copy()  # Keep games in sync
+                self._dirty = True
                 logger.info(f"Removed game: {removed.name}")
                 return True
         
@@ -205,6 +218,7 @@ class GameLibrary:
         for i, existing_game in enumerate(self.local_games):
             if existing_game.id == game.id:
                 self.local_games[i] = game
+                self._dirty = True
                 logger.info(f"Updated game: {game.name}")
                 return True
         
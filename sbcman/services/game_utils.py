@@ -106,6 +106,13 @@ def game_from_dict(data: Dict[str, Any]) -> game_pb2.Game:
     )
 
 
+def game_from_bytes(data: bytes) -> game_pb2.Game:
+    """Create protobuf Game from its binary wire format (see Game.SerializeToString)."""
+    game = game_pb2.Game()
+    game.ParseFromString(data)
+    return game
+
+
 def get_custom_resolution(game: game_pb2.Game) -> Optional[Tuple[int, int]]:
     """Get custom resolution as tuple (compatible with old interface)."""
     if game.HasField('custom_resolution'):
@@ -9,10 +9,12 @@ Manages input mapping with hierarchical resolution and per-game overrides.
 Based on: docs/code/class_services_input_handler.txt
 """
 
+import functools
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
 
 import pygame
 
@@ -21,6 +23,58 @@ from sbcman.path.paths import AppPaths
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of merged (device, game) mappings kept in memory
+MAPPING_CACHE_SIZE = 32
+
+# Semantic names per physical button index
+_SEMANTIC_BUTTON_NAMES = {
+    0: ("BUTTON_A", "BUTTON_SOUTH"),
+    1: ("BUTTON_B", "BUTTON_EAST"),
+    2: ("BUTTON_X", "BUTTON_WEST"),
+    3: ("BUTTON_Y", "BUTTON_NORTH"),
+    4: ("BUTTON_L1", "BUTTON_LB"),
+    5: ("BUTTON_R1", "BUTTON_RB"),
+    6: ("BUTTON_SELECT", "BUTTON_BACK"),
+    7: ("BUTTON_START",),
+    8: ("BUTTON_L3",),
+    9: ("BUTTON_R3",),
+    10: ("BUTTON_L2", "BUTTON_LT"),
+    11: ("BUTTON_R2", "BUTTON_RT"),
+    12: ("BUTTON_MENU",),
+    13: ("BUTTON_MENU",),  # Alternative menu button
+}
+
+# Button names indexed by button number, with the numeric name as fallback
+_BUTTON_NAMES: Tuple[Tuple[str, ...], ...] = tuple(
+    _SEMANTIC_BUTTON_NAMES.get(index, ()) + (f"BUTTON_{index}",)
+    for index in range(16)
+)
+
+# Actions bound to one (event type, key code / button index / d-pad direction)
+EventKey = Tuple[int, Any]
+
+_NO_ACTIONS: FrozenSet[str] = frozenset()
+
+# Joysticks opened so far, by device index, shared by all InputHandler instances
+_joystick_registry: Dict[int, Any] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _key_code(name: str) -> Optional[int]:
+    """
+    Resolve a mapping key name to a pygame key code.
+    
+    Args:
+        name: Key name as used in mapping files (e.g. 'RETURN', 'UP')
+        
+    Returns:
+        int: Pygame key code, or None if the name is not a keyboard key
+    """
+    try:
+        return pygame.key.key_code(name.lower())
+    except ValueError:
+        return None
+
 
 class InputHandler:
     """
@@ -55,9 +109,15 @@ class InputHandler:
         
         self.current_game_id: Optional[str] = None
         self.mappings: Dict[str, List[str]] = {}
+        self._event_actions: Dict[EventKey, FrozenSet[str]] = {}
+        self._device_layer: Dict[str, List[str]] = {}
+        self._game_layers: Dict[str, Dict[str, List[str]]] = {}
+        self._merged_cache: Dict[Tuple[str, Optional[str]],
+                                 Tuple[Dict[str, List[str]], Dict[EventKey, FrozenSet[str]]]] = {}
         self.joysticks: List[pygame.joystick.Joystick] = []
         
-        # Load mapping hierarchy
+        # Scan mapping directories once, then load mapping hierarchy
+        self._scan_mapping_files()
         self._load_mapping_hierarchy()
         
         # Initialize joysticks
@@ -65,6 +125,52 @@ class InputHandler:
         
         logger.info("InputHandler initialized")
 
+    def _scan_mapping_files(self) -> None:
+        """Record which mapping files exist so absent layers are never opened."""
+        self._config_files = self._list_files(self.config_dir)
+        self._override_files = self._list_files(self.data_dir)
+        self._game_override_files = self._list_files(self.data_dir / "games")
+
+    @staticmethod
+    def _list_files(directory: Path) -> Set[str]:
+        """
+        List the names of regular files in a directory.
+        
+        Args:
+            directory: Directory to scan
+            
+        Returns:
+            set: File names, or an empty set if the directory doesn't exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+
+    def _load_layer(self, directory: Path, present: Set[str], name: str) -> Dict[str, List[str]]:
+        """
+        Load a mapping layer if the scan found its file.
+        
+        Args:
+            directory: Directory holding the mapping file
+            present: File names found in the directory
+            name: Mapping file name
+            
+        Returns:
+            dict: Mapping dictionary or empty dict if the file is absent
+        """
+        if name not in present:
+            logger.debug("Mapping file not found: %s", directory / name)
+            return {}
+        return self._load_mapping_file(directory / name)
+
+    def reload(self) -> None:
+        """Rescan the mapping directories and reload all mapping layers."""
+        self._merged_cache.clear()
+        self._scan_mapping_files()
+        self._load_mapping_hierarchy()
+
     def _load_mapping_hierarchy(self) -> None:
         """
         Load input mappings with proper hierarchy.
@@ -74,29 +180,88 @@ class InputHandler:
         2. config/input_mappings/{device_type}.json
         3. data/input_overrides/device.json (user overrides)
         4. data/input_overrides/games/{game_id}.json (per-game, if set)
+        
+        Merged results are cached per (device, game) so switching back to
+        a previously seen game context does no file IO.
         """
+        device_type = self.hw_config.get("detected_device", "desktop")
+        cache_key = (device_type, self.current_game_id)
+        cached = self._merged_cache.get(cache_key)
+        if cached:
+            mappings, self._event_actions = cached
+            self.mappings = mappings.copy()
+            logger.debug("Using cached input mappings for %s", cache_key)
+            return
+        
         # Layer 1: Default mappings
-        default_mappings = self._load_mapping_file(self.config_dir / "default.json")
+        default_mappings = self._load_layer(self.config_dir, self._config_files, "default.json")
         self.mappings = default_mappings.copy()
         
         # Layer 2: Device-specific mappings
-        device_type = self.hw_config.get("detected_device", "desktop")
-        device_mappings = self._load_mapping_file(self.config_dir / f"{device_type}.json")
+        device_mappings = self._load_layer(self.config_dir, self._config_files, f"{device_type}.json")
         self.mappings.update(device_mappings)
         
         # Layer 3: User overrides
-        user_mappings = self._load_mapping_file(self.data_dir / "device.json")
+        user_mappings = self._load_layer(self.data_dir, self._override_files, "device.json")
         self.mappings.update(user_mappings)
+        self._device_layer = user_mappings
         
         # Layer 4: Per-game mappings (if game context is set)
         if self.current_game_id:
-            game_mappings = self._load_mapping_file(
-                self.data_dir / "games" / f"{self.current_game_id}.json"
+            game_mappings = self._load_layer(
+                self.data_dir / "games", self._game_override_files, f"{self.current_game_id}.json"
             )
             self.mappings.update(game_mappings)
+            self._game_layers[self.current_game_id] = game_mappings
+        
+        self._build_event_actions()
+        
+        # Evict the oldest entry once the cache is full
+        if len(self._merged_cache) >= MAPPING_CACHE_SIZE:
+            del self._merged_cache[next(iter(self._merged_cache))]
+        self._merged_cache[cache_key] = (self.mappings.copy(), self._event_actions)
         
         logger.info(f"Loaded input mappings: {list(self.mappings.keys())}")
 
+    def _build_event_actions(self) -> None:
+        """
+        Precompute the actions bound to each key code, button and d-pad direction.
+        
+        Key names are resolved to pygame key codes once here, so event
+        dispatch is a single dict lookup with no per-event string work.
+        """
+        name_actions: Dict[str, Set[str]] = {}
+        for action, keys in self.mappings.items():
+            for key in keys:
+                name_actions.setdefault(key.upper(), set()).add(action)
+        
+        event_actions: Dict[EventKey, Set[str]] = {}
+        for name, actions in name_actions.items():
+            if name.startswith("DPAD_"):
+                event_key: Optional[EventKey] = (pygame.JOYHATMOTION, name)
+            elif name.startswith("BUTTON_"):
+                # Buttons in the name table are resolved below
+                suffix = name[len("BUTTON_"):]
+                if not suffix.isdigit() or int(suffix) < len(_BUTTON_NAMES):
+                    continue
+                event_key = (pygame.JOYBUTTONDOWN, int(suffix))
+            else:
+                key_code = _key_code(name)
+                event_key = (pygame.KEYDOWN, key_code) if key_code is not None else None
+            if event_key is not None:
+                event_actions.setdefault(event_key, set()).update(actions)
+        
+        for button_index in range(len(_BUTTON_NAMES)):
+            for name in self._get_button_names(button_index):
+                if name in name_actions:
+                    event_actions.setdefault(
+                        (pygame.JOYBUTTONDOWN, button_index), set()
+                    ).update(name_actions[name])
+        
+        self._event_actions = {
+            event_key: frozenset(actions) for event_key, actions in event_actions.items()
+        }
+
     def _load_mapping_file(self, path: Path) -> Dict[str, List[str]]:
         """
         Load a single mapping JSON file.
@@ -107,15 +272,13 @@ class InputHandler:
         Returns:
             dict: Mapping dictionary or empty dict if file doesn't exist
         """
-        if not path.exists():
-            logger.debug(f"Mapping file not found: {path}")
-            return {}
-        
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
-            logger.debug(f"Loaded mappings from {path}")
+            data = json.loads(path.read_bytes())
+            logger.debug("Loaded mappings from %s", path)
             return data
+        except FileNotFoundError:
+            logger.debug("Mapping file not found: %s", path)
+            return {}
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in {path}: {e}")
             return {}
@@ -124,18 +287,65 @@ class InputHandler:
             return {}
 
     def _initialize_joysticks(self) -> None:
-        """Initialize all detected joysticks."""
-        pygame.joystick.init()
+        """Initialize all detected joysticks, reusing already opened ones."""
+        if not pygame.joystick.get_init():
+            # Joysticks opened before the subsystem was shut down are stale
+            _joystick_registry.clear()
+            pygame.joystick.init()
+        self.joysticks = self._open_joysticks()
+
+    @staticmethod
+    def _open_joysticks() -> List[Any]:
+        """
+        Open joysticks that are not in the registry yet, or no longer valid.
+        
+        Returns:
+            list: Opened joysticks, in device index order
+        """
         joystick_count = pygame.joystick.get_count()
         
         for i in range(joystick_count):
+            if i in _joystick_registry and InputHandler._is_joystick_open(_joystick_registry[i]):
+                continue
             try:
                 joystick = pygame.joystick.Joystick(i)
                 joystick.init()
-                self.joysticks.append(joystick)
+                _joystick_registry[i] = joystick
                 logger.info(f"Initialized joystick {i}: {joystick.get_name()}")
             except Exception as e:
                 logger.warning(f"Failed to initialize joystick {i}: {e}")
+        
+        return [_joystick_registry[i] for i in range(joystick_count) if i in _joystick_registry]
+
+    @staticmethod
+    def _is_joystick_open(joystick: Any) -> bool:
+        """
+        Check that a registered joystick still belongs to the current
+        joystick subsystem.
+        
+        Args:
+            joystick: Registered joystick
+            
+        Returns:
+            bool: True if the joystick is still initialized
+        """
+        try:
+            return bool(joystick.get_init())
+        except pygame.error:
+            return False
+
+    @classmethod
+    def rescan_joysticks(cls) -> List[Any]:
+        """
+        Reopen all joysticks, e.g. after a controller was plugged in or removed.
+        
+        Returns:
+            list: Opened joysticks, in device index order
+        """
+        _joystick_registry.clear()
+        pygame.joystick.quit()
+        pygame.joystick.init()
+        return cls._open_joysticks()
 
     def set_game_context(self, game_id: Optional[str]) -> None:
         """
@@ -163,46 +373,65 @@ class InputHandler:
         Returns:
             bool: True if action was triggered
         """
-        #print("> is_action_pressed", action)
-        if action not in self.mappings:
-            return False
+        for event in events:
+            if action in self._actions_for_event(event):
+                return True
         
-        action_keys = self.mappings[action]
+        return False
+
+    def actions_pressed(self, events: List[pygame.event.Event]) -> Set[str]:
+        """
+        Collect every action triggered in event list in a single pass.
         
-        for event in events:
-            # Check keyboard events
-            if event.type == pygame.KEYDOWN:
-                key_name = pygame.key.name(event.key).upper()
-                if key_name in action_keys:
-                    return True
-                # Also check for special keys
-                if event.key == pygame.K_RETURN and "RETURN" in action_keys:
-                    return True
-                if event.key == pygame.K_ESCAPE and "ESCAPE" in action_keys:
-                    return True
+        Args:
+            events: List of pygame events
             
-            # Check joystick button events
-            elif event.type == pygame.JOYBUTTONDOWN:
-                button_names = self._get_button_names(event.button)
-                for button_name in button_names:
-                    if button_name in action_keys:
-                        return True
+        Returns:
+            set: Names of the actions that were triggered
+        """
+        pressed: Set[str] = set()
+        for event in events:
+            pressed.update(self._actions_for_event(event))
+        return pressed
+
+    def _actions_for_event(self, event: pygame.event.Event) -> FrozenSet[str]:
+        """
+        Look up the actions triggered by a single event.
+        
+        Args:
+            event: Pygame event
             
-            # Check joystick hat (d-pad) events
-            elif event.type == pygame.JOYHATMOTION:
-                hat_x, hat_y = event.value
-                if hat_y == 1 and "DPAD_UP" in action_keys:
-                    return True
-                if hat_y == -1 and "DPAD_DOWN" in action_keys:
-                    return True
-                if hat_x == -1 and "DPAD_LEFT" in action_keys:
-                    return True
-                if hat_x == 1 and "DPAD_RIGHT" in action_keys:
-                    return True
+        Returns:
+            frozenset: Triggered action names (empty for other events)
+        """
+        # Check keyboard events
+        if event.type == pygame.KEYDOWN:
+            return self._event_actions.get((pygame.KEYDOWN, event.key), _NO_ACTIONS)
         
-        return False
+        # Check joystick button events
+        if event.type == pygame.JOYBUTTONDOWN:
+            return self._event_actions.get((pygame.JOYBUTTONDOWN, event.button), _NO_ACTIONS)
+        
+        # Check joystick hat (d-pad) events
+        if event.type == pygame.JOYHATMOTION:
+            hat_x, hat_y = event.value
+            directions = []
+            if hat_y == 1:
+                directions.append("DPAD_UP")
+            elif hat_y == -1:
+                directions.append("DPAD_DOWN")
+            if hat_x == -1:
+                directions.append("DPAD_LEFT")
+            elif hat_x == 1:
+                directions.append("DPAD_RIGHT")
+            return _NO_ACTIONS.union(*(
+                self._event_actions.get((pygame.JOYHATMOTION, direction), _NO_ACTIONS)
+                for direction in directions
+            ))
+        
+        return _NO_ACTIONS
 
-    def _get_button_names(self, button_index: int) -> List[str]:
+    def _get_button_names(self, button_index: int) -> Tuple[str, ...]:
         """
         Map button index to common semantic names.
         
@@ -210,29 +439,11 @@ class InputHandler:
             button_index: Physical button index
             
         Returns:
-            list: List of possible button names
-        """
-        button_map = {
-            0: ["BUTTON_A", "BUTTON_SOUTH"],
-            1: ["BUTTON_B", "BUTTON_EAST"],
-            2: ["BUTTON_X", "BUTTON_WEST"],
-            3: ["BUTTON_Y", "BUTTON_NORTH"],
-            4: ["BUTTON_L1", "BUTTON_LB"],
-            5: ["BUTTON_R1", "BUTTON_RB"],
-            6: ["BUTTON_SELECT", "BUTTON_BACK"],
-            7: ["BUTTON_START"],
-            8: ["BUTTON_L3"],
-            9: ["BUTTON_R3"],
-            10: ["BUTTON_L2", "BUTTON_LT"],
-            11: ["BUTTON_R2", "BUTTON_RT"],
-            12: ["BUTTON_MENU"],
-            13: ["BUTTON_MENU"],  # Alternative menu button
-        }
-        
-        names = button_map.get(button_index, [])
-        # Always include numeric name as fallback
-        names.append(f"BUTTON_{button_index}")
-        return names
+            tuple: Possible button names, always ending with the numeric name
+        """
+        if 0 <= button_index < len(_BUTTON_NAMES):
+            return _BUTTON_NAMES[button_index]
+        return (f"BUTTON_{button_index}",)
 
     def save_mapping(self, action: str, keys: List[str], scope: str = "device") -> None:
         """
@@ -245,29 +456,64 @@ class InputHandler:
         """
         # Update current mappings
         self.mappings[action] = keys
+        self._build_event_actions()
         
         # Determine save path
         if scope == "game" and self.current_game_id:
             save_path = self.data_dir / "games" / f"{self.current_game_id}.json"
+            present = self._game_override_files
+            layer = self._game_layers.setdefault(self.current_game_id, {})
+            # Only merged mappings for this game include the game layer
+            for key in [k for k in self._merged_cache if k[1] == self.current_game_id]:
+                del self._merged_cache[key]
         else:
             save_path = self.data_dir / "device.json"
+            present = self._override_files
+            layer = self._device_layer
+            # The device layer is part of every merged mapping
+            self._merged_cache.clear()
         
         # Ensure directory exists
         save_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Load existing mappings
-        existing = self._load_mapping_file(save_path)
-        
-        # Merge new mapping
-        existing[action] = keys
+        # Merge new mapping into the in-memory layer loaded from this file
+        layer[action] = keys
         
-        # Save to file
+        # Save atomically so a power loss never leaves a truncated file: the
+        # data is on disk before the rename, and the rename before returning
         try:
-            with open(save_path, "w") as f:
-                json.dump(existing, f, indent=2)
-            logger.info(f"Saved mapping for {action} to {save_path}")
+            tmp_path = save_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(layer, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, save_path)
         except Exception as e:
             logger.error(f"Failed to save mapping: {e}")
+            return
+
+        present.add(save_path.name)
+        logger.info(f"Saved mapping for {action} to {save_path}")
+
+        # The mapping is saved either way; this only makes the rename durable
+        try:
+            self._fsync_directory(save_path.parent)
+        except OSError as e:
+            logger.warning(f"Could not flush {save_path.parent} to disk: {e}")
+
+    @staticmethod
+    def _fsync_directory(path: Path) -> None:
+        """
+        Flush a directory entry change, such as a rename, to disk.
+        
+        Args:
+            path: Directory to flush
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
     def get_current_mappings(self) -> Dict[str, List[str]]:
         """
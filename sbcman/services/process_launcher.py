@@ -9,18 +9,25 @@ Launches games as subprocesses with pre/post command support.
 Based on: docs/code/class_services_process_launcher.txt
 """
 
+import contextlib
 import os
 import multiprocessing
 import subprocess
 import logging
 import importlib
+import shutil
+import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from sbcman.proto import game_pb2
+from .game_utils import get_custom_resolution
 
 logger = logging.getLogger(__name__)
 
+# Game output log, written to the install directory when capture is enabled
+GAME_LOG_FILE = "game_output.log"
+
 
 class ProcessLauncher:
     """
@@ -39,6 +46,17 @@ class ProcessLauncher:
             hw_config: Hardware configuration dictionary
         """
         self.hw_config = hw_config
+        
+        # Resolve the interpreter once. An absolute executable and no
+        # preexec_fn/start_new_session keep subprocess on its vfork /
+        # posix_spawn fast path instead of a full fork of this process.
+        self.python_executable = shutil.which("python3") or sys.executable
+
+        # Game-independent variables added to every launch environment
+        self._base_env_extra = {
+            "DEVICE_TYPE": self.hw_config.get("detected_device", "desktop"),
+            "OS_TYPE": self.hw_config.get("detected_os", "standard_linux"),
+        }
 
     def launch_game(self, game: game_pb2.Game) -> bool:
         if not game.installed:
@@ -88,7 +106,7 @@ class ProcessLauncher:
         
     def launch_game_subprocess(self, game: game_pb2.Game) -> bool:
         """
-        Launch game process.
+        Launch game process and wait for it to exit.
         
         Args:
             game: Game to launch
@@ -96,19 +114,45 @@ class ProcessLauncher:
         Returns:
             bool: True if launch succeeded
         """
+        process = self.start_game_subprocess(game)
+        if process is None:
+            return False
+        
+        try:
+            # Wait for game to finish
+            process.wait()
+        except Exception as e:
+            logger.error(f"Failed to wait for game: {e}")
+            return False
+        
+        return self.finish_game_subprocess(game, process)
+
+    def start_game_subprocess(self, game: game_pb2.Game) -> Optional[subprocess.Popen]:
+        """
+        Start game process without waiting for it to exit.
+        
+        The caller monitors the process (e.g. with is_running) and calls
+        finish_game_subprocess once it has exited.
+        
+        Args:
+            game: Game to launch
+            
+        Returns:
+            Popen: Running game process, or None if the launch failed
+        """
         if not game.installed:
             logger.error(f"Cannot launch uninstalled game: {game.name}")
-            return False
+            return None
         
         if not Path(game.install_path).exists():
             logger.error(f"Game installation path not found: {game.install_path}")
-            return False
+            return None
         
         entry_point = Path(game.install_path) / game.entry_point
         #entry_point = Path("/home/havardrb/.local/lib/python3.11/site-packages/maxblok/fish/main.py")
         if not entry_point.exists():
             logger.error(f"Game entry point not found: {entry_point}")
-            return False
+            return None
         
         try:
             logger.info(f"Launching game: {game.name}")
@@ -119,33 +163,50 @@ class ProcessLauncher:
             # Build environment
             env = self._build_environment(game)
             
-            # Launch game process
-            process = subprocess.Popen(
-                ["python3", str(entry_point)],
-                cwd=str(game.install_path),
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            
-            # Wait for game to finish
-            stdout, stderr = process.communicate()
-            
-            if process.returncode != 0:
-                logger.error(f"Game exited with error code {process.returncode}")
-                if stderr:
-                    logger.error(f"Error output: {stderr.decode()}")
+            # Launch game process. Output goes straight to DEVNULL or a log
+            # file so a long session is never buffered in memory. The child
+            # keeps its own copy of the log file descriptor.
+            if self.hw_config.get("capture_game_output", False):
+                output_target = open(Path(game.install_path) / GAME_LOG_FILE, "wb", buffering=0)
             else:
-                logger.info(f"Game exited normally: {game.name}")
-            
-            # Run post-launch commands
-            self._run_post_commands(game)
+                output_target = contextlib.nullcontext(subprocess.DEVNULL)
             
-            return process.returncode == 0
+            with output_target as output:
+                return subprocess.Popen(
+                    [self.python_executable, str(entry_point)],
+                    cwd=str(game.install_path),
+                    env=env,
+                    stdout=output,
+                    stderr=subprocess.STDOUT,
+                )
             
         except Exception as e:
             logger.error(f"Failed to launch game: {e}")
-            return False
+            return None
+
+    def finish_game_subprocess(self, game: game_pb2.Game, process: subprocess.Popen) -> bool:
+        """
+        Report the exit of a game process and run post-launch commands.
+        
+        Args:
+            game: Game that was launched
+            process: Exited game process
+            
+        Returns:
+            bool: True if the game exited normally
+        """
+        if process.returncode != 0:
+            logger.error(f"Game exited with error code {process.returncode}")
+            if self.hw_config.get("capture_game_output", False):
+                log_path = Path(game.install_path) / GAME_LOG_FILE
+                logger.error(f"Game output written to {log_path}")
+        else:
+            logger.info(f"Game exited normally: {game.name}")
+        
+        # Run post-launch commands
+        self._run_post_commands(game)
+        
+        return process.returncode == 0
 
     def _run_pre_commands(self, game: game_pb2.Game) -> None:
         """
@@ -203,21 +264,19 @@ class ProcessLauncher:
         Returns:
             dict: Environment variables
         """
-        # Start with current environment
+        # Start with current environment plus hardware config info
         env = os.environ.copy()
+        env.update(self._base_env_extra)
         
         # Add game-specific environment variables
-        if game.custom_resolution:
-            width, height = game.custom_resolution
+        resolution = get_custom_resolution(game)
+        if resolution:
+            width, height = resolution
             env["GAME_RESOLUTION"] = f"{width}x{height}"
         
         if game.custom_fps:
             env["GAME_FPS"] = str(game.custom_fps)
         
-        # Add hardware config info
-        env["DEVICE_TYPE"] = self.hw_config.get("detected_device", "desktop")
-        env["OS_TYPE"] = self.hw_config.get("detected_os", "standard_linux")
-        
         return env
 
     def is_running(self, process: Optional[subprocess.Popen]) -> bool:
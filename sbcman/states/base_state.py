@@ -4,7 +4,7 @@
 """Base State Module - Abstract base class for all application states."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple, TYPE_CHECKING
+from typing import Dict, Optional, List, Tuple, TYPE_CHECKING
 
 import pygame
 
@@ -43,6 +43,9 @@ LIST_MARGIN_LARGE = 80
 # Progress area
 PROGRESS_AREA_HEIGHT = 120
 
+# Maximum number of rendered text surfaces kept per state
+TEXT_CACHE_SIZE = 64
+
 
 class BaseState(ABC):
     """Abstract base class for application states."""
@@ -56,6 +59,10 @@ class BaseState(ABC):
         self.input_handler = state_manager.input_handler
         self.app_paths = state_manager.app_paths
 
+        # Fonts and rendered text reused across frames
+        self._fonts: Dict[int, pygame.font.Font] = {}
+        self._text_cache: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+
     @abstractmethod
     def on_enter(self, previous_state: Optional["BaseState"]) -> None:
         """
@@ -113,6 +120,18 @@ class BaseState(ABC):
         """
         pass
 
+    def owns_display(self) -> bool:
+        """
+        Whether the launcher draws to the display in this state.
+
+        States that hand the screen over to another process return False,
+        and the game loop then skips rendering and flipping the display.
+
+        Returns:
+            bool: True if the state should be rendered
+        """
+        return True
+
     def _handle_exit_input(self, events: List[pygame.event.Event]) -> bool:
         """Check for exit input (ESC key or specific buttons)."""
         for event in events:
@@ -131,6 +150,26 @@ class BaseState(ABC):
         """Fill surface with standard background color."""
         surface.fill(BACKGROUND_COLOR)
 
+    def _get_font(self, font_size: int) -> pygame.font.Font:
+        """Return the default font at the given size, created once per state."""
+        font = self._fonts.get(font_size)
+        if font is None:
+            font = pygame.font.Font(None, font_size)
+            self._fonts[font_size] = font
+        return font
+
+    def _render_text(self, text: str, font_size: int,
+                     color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text with the default font, reusing surfaces from earlier frames."""
+        key = (text, font_size, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            text_surface = self._get_font(font_size).render(text, True, color)
+            self._text_cache[key] = text_surface
+        return text_surface
+
     def _get_surface_dimensions(self, surface: pygame.Surface) -> Tuple[int, int]:
         """Return surface width and height as a tuple."""
         return surface.get_width(), surface.get_height()
@@ -146,8 +185,7 @@ class BaseState(ABC):
         """Render centered title with adaptive font size."""
         surface_width = surface.get_width()
         font_size = self._calc_font_size(surface_width, divisor, min_size, max_size)
-        font = pygame.font.Font(None, font_size)
-        title = font.render(title_text, True, TEXT_COLOR)
+        title = self._render_text(title_text, font_size, TEXT_COLOR)
         title_rect = title.get_rect(center=(surface_width // 2, y_position))
         surface.blit(title, title_rect)
 
@@ -157,8 +195,7 @@ class BaseState(ABC):
         """Render centered subtitle with adaptive font size."""
         surface_width = surface.get_width()
         font_size = self._calc_font_size(surface_width, divisor, min_size, max_size)
-        font = pygame.font.Font(None, font_size)
-        subtitle = font.render(subtitle_text, True, SUBTITLE_COLOR)
+        subtitle = self._render_text(subtitle_text, font_size, SUBTITLE_COLOR)
         subtitle_rect = subtitle.get_rect(center=(surface_width // 2, y_position))
         surface.blit(subtitle, subtitle_rect)
 
@@ -169,7 +206,6 @@ class BaseState(ABC):
         """Render adaptive instructions at the bottom of the screen."""
         surface_width, surface_height = self._get_surface_dimensions(surface)
         font_size = self._calc_font_size(surface_width, divisor, min_size, max_size)
-        font = pygame.font.Font(None, font_size)
 
         instructions = base_instructions
         if (scrollable_list is not None and
@@ -178,7 +214,7 @@ class BaseState(ABC):
                 scrollable_list.show_scroll_indicators):
             instructions += "  |  PageUp/Down Fast Scroll"
 
-        inst_surface = font.render(instructions, True, INSTRUCTION_COLOR)
+        inst_surface = self._render_text(instructions, font_size, INSTRUCTION_COLOR)
         inst_rect = inst_surface.get_rect(center=(surface_width // 2, surface_height - y_offset))
         surface.blit(inst_surface, inst_rect)
 
@@ -186,8 +222,7 @@ class BaseState(ABC):
                               y_position: int, color: Tuple[int, int, int] = TEXT_COLOR,
                               font_size: int = 32) -> None:
         """Render centered text at specified y position."""
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(text, True, color)
+        text_surface = self._render_text(text, font_size, color)
         text_rect = text_surface.get_rect(center=(surface.get_width() // 2, y_position))
         surface.blit(text_surface, text_rect)
 
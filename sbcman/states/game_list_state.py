@@ -30,17 +30,19 @@ class GameListState(base_state.BaseState):
         pass
 
     def handle_events(self, events: List[pygame.event.Event]) -> None:
-        if self.input_handler.is_action_pressed("cancel", events) or self._handle_exit_input(events):
+        pressed = self.input_handler.actions_pressed(events)
+
+        if "cancel" in pressed or self._handle_exit_input(events):
             self.state_manager.change_state("menu")
             return
 
         if hasattr(self, 'game_list') and self.games:
-            if self.input_handler.is_action_pressed("up", events):
+            if "up" in pressed:
                 self.game_list.scroll_up()
-            elif self.input_handler.is_action_pressed("down", events):
+            elif "down" in pressed:
                 self.game_list.scroll_down()
 
-            if self.input_handler.is_action_pressed("confirm", events):
+            if "confirm" in pressed:
                 self._launch_game()
 
     def _setup_adaptive_scrollable_list(self) -> None:
@@ -4,7 +4,6 @@
 """Playing State Module - State for running a game as a subprocess."""
 
 import logging
-import subprocess
 from typing import Optional, List
 
 import pygame
@@ -22,6 +21,8 @@ class PlayingState(base_state.BaseState):
         logger.info("Entered playing state")
 
         game = self.state_manager.selected_game
+        self.game = game
+        self.game_process = None
 
         if game is None:
             logger.error("No game selected for launch")
@@ -31,52 +32,56 @@ class PlayingState(base_state.BaseState):
 
         logger.info(f"Launching game: {game.name}")
 
-        self.game_running = True
         self.launcher = process_launcher.ProcessLauncher(self.hw_config)
-        self.game_process = None
 
+        # Start the game without blocking; update() polls for its exit so
+        # the main loop keeps running while the game plays.
         try:
-            self.launcher.launch_game(game)
-            self.message = f"Playing: {game.name}"
+            self.game_process = self.launcher.start_game_subprocess(game)
         except Exception as e:
             logger.error(f"Failed to launch game: {e}")
-            self.message = f"Error launching game: {e}"
+            self.game_process = None
+
+        if self.game_process is None:
+            self.message = f"Error launching game: {game.name}"
             self.game_running = False
+            return
+
+        self.game_running = True
+        self.message = f"Playing: {game.name}"
 
     def on_exit(self) -> None:
         logger.info("Exited playing state")
 
-        if self.game_process and self._is_process_running():
-            logger.info("Terminating game process")
-            self.game_process.terminate()
-
-            try:
-                self.game_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                logger.warning("Process did not terminate gracefully, killing")
-                self.game_process.kill()
+        if self.game_process is not None:
+            self.launcher.terminate(self.game_process)
+            self.launcher.finish_game_subprocess(self.game, self.game_process)
 
         self.game_running = False
         self.game_process = None
+        self.game = None
         self.state_manager.selected_game = None
 
-    def _is_process_running(self) -> bool:
-        if self.game_process is None:
-            return False
-        return self.game_process.poll() is None
-
     def update(self, dt: float) -> None:
         if self.game_running and self.game_process is not None:
-            if not self._is_process_running():
+            if not self.launcher.is_running(self.game_process):
                 logger.info("Game process has exited")
 
-                exit_code = self.game_process.poll()
-                if exit_code != 0:
-                    logger.error(f"Game exited with error code: {exit_code}")
+                self.launcher.finish_game_subprocess(self.game, self.game_process)
+                self.game_process = None
+                self.game_running = False
 
                 self.state_manager.change_state("game_list")
 
+    def owns_display(self) -> bool:
+        # The game has the screen while it runs
+        return not self.game_running
+
     def handle_events(self, events: List[pygame.event.Event]) -> None:
+        # Input while the game runs is meant for the game, not the launcher
+        if self.game_running:
+            return
+
         if self.input_handler.is_action_pressed("cancel", events) or self._handle_exit_input(events):
             logger.info("User requested to exit game")
             self.state_manager.change_state("game_list")
@@ -9,7 +9,7 @@ Only shows scroll indicators when content exceeds available vertical space.
 """
 
 import pygame
-from typing import List, Callable, Optional, Tuple
+from typing import Dict, List, Callable, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -74,6 +74,9 @@ class ScrollableList:
         # Fonts
         self.font = pygame.font.Font(None, font_size)
         
+        # Rendered item text, keyed by (text, color, max width)
+        self._item_surfaces: Dict[Tuple[str, Tuple[int, int, int], int], pygame.Surface] = {}
+        
         # Scroll indicators (only shown when needed)
         self.show_scroll_indicators = False
         self.scroll_indicator_color = (100, 100, 100)
@@ -87,6 +90,7 @@ class ScrollableList:
             item_states: Optional list of booleans indicating if items are enabled/disabled
         """
         self.items = items
+        self._item_surfaces.clear()
         self.selected_index = min(self.selected_index, len(items) - 1) if items else 0
         self.scroll_offset = 0
         self.item_states = item_states or [True] * len(items)
@@ -247,8 +251,7 @@ class ScrollableList:
             
             # Render text (truncate if too long)
             max_text_width = self.width - 4 * self.padding
-            rendered_text = self._truncate_text(item_text, max_text_width)
-            text_surface = self.font.render(rendered_text, True, text_color)
+            text_surface = self._render_item_text(item_text, text_color, max_text_width)
             surface.blit(text_surface, (self.x + 2 * self.padding, current_y + 5))
             
             current_y += self.item_height
@@ -257,6 +260,26 @@ class ScrollableList:
         if self.show_scroll_indicators and self.needs_scrolling:
             self._render_scroll_indicators(surface)
             
+    def _render_item_text(self, text: str, color: Tuple[int, int, int], max_width: int) -> pygame.Surface:
+        """
+        Render truncated item text, reusing the surface from earlier frames.
+        
+        Args:
+            text: Item text
+            color: Text color
+            max_width: Maximum width in pixels
+            
+        Returns:
+            Rendered text surface
+        """
+        key = (text, color, max_width)
+        text_surface = self._item_surfaces.get(key)
+        if text_surface is None:
+            rendered_text = self._truncate_text(text, max_width)
+            text_surface = self.font.render(rendered_text, True, color)
+            self._item_surfaces[key] = text_surface
+        return text_surface
+            
     def _truncate_text(self, text: str, max_width: int) -> str:
         """
         Truncate text to fit within maximum width.
@@ -4,176 +4,75 @@
 """
 Test Configuration and Fixtures
 
-Provides common fixtures and setup for all tests.
+Provides the pytest fixtures and setup for all tests. Helpers shared with
+tests run outside pytest live in tests/test_utils.py.
 """
 
+import importlib
 import os
 import sys
-import json
 import tempfile
+import warnings
 from pathlib import Path
-from unittest.mock import Mock, MagicMock
+from unittest.mock import MagicMock
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+
+# Add the repository root to path for imports, once
+REPO_ROOT = str(Path(__file__).parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
 
 # Set SDL to dummy mode for headless testing
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
-# Mock protobuf modules that may not be compiled
-sys.modules['sbcman.proto.game_pb2'] = MagicMock()
-sys.modules['sbcman.proto.device_config_pb2'] = MagicMock()
-sys.modules['sbcman.proto.os_config_pb2'] = MagicMock()
-sys.modules['sbcman.proto.input_mappings_pb2'] = MagicMock()
+# Use the native (upb) protobuf runtime for compiled modules
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
 
+PROTO_MODULES = [
+    'sbcman.proto.game_pb2',
+    'sbcman.proto.device_config_pb2',
+    'sbcman.proto.os_config_pb2',
+    'sbcman.proto.input_mappings_pb2',
+]
 
-def mock_hw_config():
-    """Create a minimal hardware configuration for testing."""
-    return {
-        "detected_device": "desktop",
-        "detected_os": "standard_linux",
-        "display": {
-            "resolution": [1280, 720],
-            "fullscreen": False,
-            "fps_target": 60,
-            "hide_cursor": False,
-        },
-        "input": {
-            "joystick_enabled": True,
-            "keyboard_enabled": True,
-        },
-        "paths": {
-            "games": str(Path.home() / "games"),
-            "data": str(Path.home() / ".local/share/sbc-man"),
-            "config": str(Path.home() / ".config/sbc-man"),
-        },
-        "probed_hardware": {
-            "display": {
-                "current_resolution": [1280, 720],
-                "available_modes": [],
-                "hardware_accelerated": False,
-                "bit_depth": 32,
-            },
-            "input": {
-                "has_keyboard": True,
-                "joystick_count": 0,
-                "joysticks": [],
-            },
-            "storage": {},
-            "cpu": {
-                "core_count": 4,
-                "architecture": "x86",
-            },
-        },
-    }
+# Use the compiled protobuf modules when available, mock the ones that
+# have not been compiled
+for module_name in PROTO_MODULES:
+    try:
+        importlib.import_module(module_name)
+    except ImportError:
+        sys.modules[module_name] = MagicMock()
 
 
-def mock_game_data():
-    """Create sample game data for testing."""
-    return [
-        {
-            "id": "test-game-1",
-            "name": "Test Game 1",
-            "version": "1.0.0",
-            "description": "A test game",
-            "author": "Test Author",
-            "install_path": "/tmp/games/test-game-1",
-            "entry_point": "main.py",
-            "installed": True,
-            "download_url": "https://example.com/game1.zip",
-            "custom_input_mappings": {},
-            "custom_resolution": None,
-            "custom_fps": None,
-        },
-        {
-            "id": "test-game-2",
-            "name": "Test Game 2",
-            "version": "2.0.0",
-            "description": "Another test game",
-            "author": "Test Author",
-            "install_path": "/tmp/games/test-game-2",
-            "entry_point": "main.py",
-            "installed": False,
-            "download_url": "https://example.com/game2.zip",
-            "custom_input_mappings": {},
-            "custom_resolution": None,
-            "custom_fps": None,
-        },
-    ]
+@pytest.fixture(scope="session", autouse=True)
+def protobuf_runtime():
+    """Warn when compiled protobuf modules run on the pure-Python runtime and warm them up."""
+    compiled = [sys.modules[name] for name in PROTO_MODULES
+                if not isinstance(sys.modules[name], MagicMock)]
+    if compiled:
+        from google.protobuf.internal import api_implementation
+        if api_implementation.Type() == "python":
+            warnings.warn("protobuf is using the pure-Python runtime; tests will run slower")
 
+    # Construct one message of each type so message class setup is not
+    # paid inside the first test that uses it
+    for module in compiled:
+        for message_name in module.DESCRIPTOR.message_types_by_name:
+            getattr(module, message_name)()
+    yield
 
-class TempConfigDir:
-    """Context manager for temporary config directory."""
-    
-    def __init__(self):
-        self.temp_dir = None
-        self.devices_dir = None
-        self.os_types_dir = None
-        self.input_mappings_dir = None
-    
-    def __enter__(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.devices_dir = Path(self.temp_dir) / "devices"
-        self.os_types_dir = Path(self.temp_dir) / "os_types"
-        self.input_mappings_dir = Path(self.temp_dir) / "input_mappings"
-        
-        # Create directories
-        self.devices_dir.mkdir(parents=True)
-        self.os_types_dir.mkdir(parents=True)
-        self.input_mappings_dir.mkdir(parents=True)
-        
-        # Create default config files
-        default_device = {
-            "device_type": "default",
-            "display": {"resolution": "auto", "fullscreen": False, "fps_target": 60},
-            "paths": {"games": "~/games", "data": "~/.local/share/sbc-man"},
-        }
-        
-        with open(self.devices_dir / "default.json", "w") as f:
-            json.dump(default_device, f)
-        
-        default_input = {
-            "confirm": ["BUTTON_A", "RETURN"],
-            "cancel": ["BUTTON_B", "ESCAPE"],
-            "up": ["DPAD_UP", "UP"],
-            "down": ["DPAD_DOWN", "DOWN"],
-        }
-        
-        with open(self.input_mappings_dir / "default.json", "w") as f:
-            json.dump(default_input, f)
-        
-        return self
-    
-    def __exit__(self, *args):
-        import shutil
-        if self.temp_dir:
-            shutil.rmtree(self.temp_dir)
 
+@pytest.fixture(scope="session", autouse=True)
+def worker_tempdir(tmp_path_factory):
+    """Create tempfile directories under pytest's base temp directory.
 
-class TempDataDir:
-    """Context manager for temporary data directory."""
-    
-    def __init__(self):
-        self.temp_dir = None
-        self.games_file = None
-        self.config_file = None
-    
-    def __enter__(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.games_file = Path(self.temp_dir) / "games.json"
-        self.config_file = Path(self.temp_dir) / "config.json"
-        
-        # Create empty files
-        with open(self.games_file, "w") as f:
-            json.dump([], f)
-        
-        with open(self.config_file, "w") as f:
-            json.dump({}, f)
-        
-        return self
-    
-    def __exit__(self, *args):
-        import shutil
-        if self.temp_dir:
-            shutil.rmtree(self.temp_dir)
+    The base directory is unique per run, and per worker under pytest-xdist,
+    so parallel workers do not share a temp directory and pytest prunes
+    directories left behind by tests using tempfile.mkdtemp().
+    """
+    previous = tempfile.tempdir
+    tempfile.tempdir = str(tmp_path_factory.mktemp("tempfile", numbered=False))
+    yield
+    tempfile.tempdir = previous
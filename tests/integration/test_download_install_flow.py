@@ -8,44 +8,29 @@ Tests the complete download and installation workflow.
 """
 
 import unittest
-import tempfile
 import os
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 import pygame
 
+from tests.test_utils import IntegrationTestCase
 from sbcman.states.download_state import DownloadState
 from sbcman.proto import game_pb2
 
 
-class TestDownloadInstallFlow(unittest.TestCase):
+# Placeholder event list; handle_events input is mocked in these tests
+DUMMY_EVENTS = [Mock(spec=pygame.event.Event)]
+
+
+class TestDownloadInstallFlow(IntegrationTestCase):
     """Integration tests for download and install flow."""
     
     def setUp(self):
         """Set up test fixtures."""
-        # Initialize pygame for testing
-        pygame.init()
-        
         # Create a mock state manager
         self.mock_state_manager = Mock()
         
-        # Create temporary directories
-        self.temp_data_dir = tempfile.mkdtemp()
-        self.temp_games_dir = tempfile.mkdtemp()
-        
-        # Create a mock hardware config
-        self.hw_config = {
-            "paths": {
-                "data": self.temp_data_dir,
-                "games": self.temp_games_dir,
-            },
-            "display": {
-                "resolution": [1280, 720],
-                "fps_target": 60,
-            }
-        }
-        
         # Create a mock game library
         self.mock_game_library = Mock()
         
@@ -58,15 +43,6 @@ class TestDownloadInstallFlow(unittest.TestCase):
         self.download_state.game_library = self.mock_game_library
         self.download_state.input_handler = self.mock_input_handler
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        pygame.quit()
-        
-        # Clean up temporary directories
-        import shutil
-        shutil.rmtree(self.temp_data_dir)
-        shutil.rmtree(self.temp_games_dir)
-    
     @patch('pathlib.Path.unlink')
     @patch.object(DownloadState, '_start_download')
     def test_download_and_install_flow(self, mock_start_download, mock_unlink):
@@ -75,20 +51,22 @@ class TestDownloadInstallFlow(unittest.TestCase):
         mock_unlink.return_value = None
         
         # Create test games
-        game1 = game_pb2.Game()
-        game1.id = "game1"
-        game1.name = "Game 1"
-        game1.installed = True
-        game1.install_path="/tmp/games/test-game-1"
-        game1.entry_point="main.py"        
+        game1 = game_pb2.Game(
+            id="game1",
+            name="Game 1",
+            installed=True,
+            install_path="/tmp/games/test-game-1",
+            entry_point="main.py",
+        )
 
-        game2 = game_pb2.Game()
-        game2.id = "game2"
-        game2.name = "Game 2"
-        game2.installed = False
-        game2.install_path="/tmp/games/test-game-2"
-        game2.entry_point="game.py"
-        game2.download_url="https://example.com/test-game-2.zip"        
+        game2 = game_pb2.Game(
+            id="game2",
+            name="Game 2",
+            installed=False,
+            install_path="/tmp/games/test-game-2",
+            entry_point="game.py",
+            download_url="https://example.com/test-game-2.zip",
+        )
 
         test_games = [game1, game2]        
         
@@ -113,7 +91,7 @@ class TestDownloadInstallFlow(unittest.TestCase):
         with patch.object(self.mock_input_handler, 'is_action_pressed') as mock_action:
             mock_action.side_effect = lambda action, events: action == "confirm"
             
-            mock_events = [Mock()]
+            mock_events = DUMMY_EVENTS
             self.download_state.handle_events(mock_events)
             
             # Verify that downloading started
@@ -6,87 +6,66 @@ Integration Tests for Game Launch Flow
 """
 
 import unittest
-import tempfile
 import os
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
 import pygame
 
+from tests.test_utils import IntegrationTestCase
 from sbcman.states.game_list_state import GameListState
 from sbcman.states.playing_state import PlayingState
 from sbcman.proto import game_pb2
 
 
-class TestGameLaunchFlow(unittest.TestCase):
+# Placeholder event list; handle_events input is mocked in these tests
+DUMMY_EVENTS = [Mock(spec=pygame.event.Event)]
+
+
+class TestGameLaunchFlow(IntegrationTestCase):
     """Integration tests for game launch flow."""
 
     def setUp(self):
         """Set up test fixtures."""
-        # Initialize pygame for testing
-        pygame.init()
-        
         # Create a mock state manager
         self.mock_state_manager = Mock()
         
-        # Create temporary directories
-        self.temp_data_dir = tempfile.mkdtemp()
-        self.temp_games_dir = tempfile.mkdtemp()
-        
-        # Create a mock hardware config
-        self.hw_config = {
-            "paths": {
-                "data": self.temp_data_dir,
-                "games": self.temp_games_dir,
-            },
-            "display": {
-                "resolution": [1280, 720],
-                "fps_target": 60,
-            }
-        }
-        
-        # Create a mock game library
-        self.mock_game_library = Mock()
+        # Create a game library stub; tests set get_all_games
+        self.stub_game_library = SimpleNamespace(get_all_games=lambda: [])
         
         # Create a mock input handler
         self.mock_input_handler = Mock()
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        pygame.quit()
-        
-        # Clean up temporary directories
-        import shutil
-        shutil.rmtree(self.temp_data_dir)
-        shutil.rmtree(self.temp_games_dir)
-
     def test_game_list_state_initialization(self):
         """Test game list state initialization and game loading."""
         # Create test games
-        game1 = game_pb2.Game()
-        game1.id = "game1"
-        game1.name = "Game 1"
-        game1.installed = True
-        game1.install_path="/tmp/games/test-game-1"
-        game1.entry_point="main.py"        
-
-        game2 = game_pb2.Game()
-        game2.id = "game2"
-        game2.name = "Game 2"
-        game2.installed = False
-        game2.install_path="/tmp/games/test-game-2"
-        game2.entry_point="game.py"
-        game2.download_url="https://example.com/test-game-2.zip"        
+        game1 = game_pb2.Game(
+            id="game1",
+            name="Game 1",
+            installed=True,
+            install_path="/tmp/games/test-game-1",
+            entry_point="main.py",
+        )
+
+        game2 = game_pb2.Game(
+            id="game2",
+            name="Game 2",
+            installed=False,
+            install_path="/tmp/games/test-game-2",
+            entry_point="game.py",
+            download_url="https://example.com/test-game-2.zip",
+        )
 
         test_games = [game1, game2]
         
         # Configure mock game library to return test games
-        self.mock_game_library.get_all_games.return_value = test_games
+        self.stub_game_library.get_all_games = lambda: test_games
         
         # Create game list state
         game_list_state = GameListState(self.mock_state_manager)
         game_list_state.hw_config = self.hw_config
-        game_list_state.game_library = self.mock_game_library
+        game_list_state.game_library = self.stub_game_library
         game_list_state.input_handler = self.mock_input_handler
         
         # Enter the game list state
@@ -99,30 +78,32 @@ class TestGameLaunchFlow(unittest.TestCase):
     def test_game_selection_navigation(self):
         """Test game selection navigation in game list state."""
         # Create test games
-        game1 = game_pb2.Game()
-        game1.id = "game1"
-        game1.name = "Game 1"
-        game1.installed = True
-        game1.install_path="/tmp/games/test-game-1"
-        game1.entry_point="main.py"        
-
-        game2 = game_pb2.Game()
-        game2.id = "game2"
-        game2.name = "Game 2"
-        game2.installed = False
-        game2.install_path="/tmp/games/test-game-2"
-        game2.entry_point="game.py"
-        game2.download_url="https://example.com/test-game-2.zip"        
+        game1 = game_pb2.Game(
+            id="game1",
+            name="Game 1",
+            installed=True,
+            install_path="/tmp/games/test-game-1",
+            entry_point="main.py",
+        )
+
+        game2 = game_pb2.Game(
+            id="game2",
+            name="Game 2",
+            installed=False,
+            install_path="/tmp/games/test-game-2",
+            entry_point="game.py",
+            download_url="https://example.com/test-game-2.zip",
+        )
 
         test_games = [game1, game2]
         
         # Configure mock game library to return test games
-        self.mock_game_library.get_all_games.return_value = test_games
+        self.stub_game_library.get_all_games = lambda: test_games
         
         # Create game list state
         game_list_state = GameListState(self.mock_state_manager)
         game_list_state.hw_config = self.hw_config
-        game_list_state.game_library = self.mock_game_library
+        game_list_state.game_library = self.stub_game_library
         game_list_state.input_handler = self.mock_input_handler
         
         # Enter the game list state
@@ -132,10 +113,10 @@ class TestGameLaunchFlow(unittest.TestCase):
         self.assertEqual(game_list_state.game_list.selected_index, 0)
         
         # Mock input handler to simulate down navigation
-        with patch.object(self.mock_input_handler, 'is_action_pressed') as mock_action:
-            mock_action.side_effect = lambda action, events: action == "down"
+        with patch.object(self.mock_input_handler, 'actions_pressed') as mock_action:
+            mock_action.return_value = {"down"}
             
-            mock_events = [Mock()]
+            mock_events = DUMMY_EVENTS
             game_list_state.handle_events(mock_events)
             
             # Verify selection moved
@@ -146,7 +127,7 @@ class TestGameLaunchFlow(unittest.TestCase):
         # Create playing state
         playing_state = PlayingState(self.mock_state_manager)
         playing_state.hw_config = self.hw_config
-        playing_state.game_library = self.mock_game_library
+        playing_state.game_library = self.stub_game_library
         playing_state.input_handler = self.mock_input_handler
         
         # Enter the playing state
@@ -5,15 +5,11 @@
 Integration Tests for State Transition Flow
 """
 
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock
 import os
-import shutil
-import tempfile
 import unittest
 
-import pygame
-
+from tests.test_utils import IntegrationTestCase
 from sbcman.core.state_manager import StateManager
 from sbcman.path.paths import AppPaths
 from sbcman.states.download_state import DownloadState
@@ -22,35 +18,26 @@ from sbcman.states.menu_state import MenuState
 from sbcman.states.settings_state import SettingsState
 
 
-class TestStateTransitionFlow(unittest.TestCase):
+# Keep test directories in memory (tmpfs) where available
+TEMP_BASE = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+class TestStateTransitionFlow(IntegrationTestCase):
     """Integration tests for state transition flow."""
 
+    temp_base = TEMP_BASE
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests in the class."""
+        super().setUpClass()
+        cls.app_paths = AppPaths(cls.temp_data_dir, cls.temp_data_dir)
+
     def setUp(self):
         """Set up test fixtures."""
-        # Initialize pygame for testing
-        pygame.init()
-        
         # Create a mock screen
         self.mock_screen = Mock()
         
-        # Create temporary directories for testing
-        self.temp_data_dir = Path(tempfile.mkdtemp())
-        self.temp_games_dir = Path(tempfile.mkdtemp())
-
-        self.app_paths = AppPaths(self.temp_data_dir, self.temp_data_dir)
-        
-        # Create a mock hardware config
-        self.hw_config = {
-            "paths": {
-                "data": self.temp_data_dir,
-                "games": self.temp_games_dir,
-            },
-            "display": {
-                "resolution": [1280, 720],
-                "fps_target": 60,
-            }
-        }
-        
         # Create mock components
         self.mock_config = Mock()
         self.mock_game_library = Mock()
@@ -65,15 +52,8 @@ class TestStateTransitionFlow(unittest.TestCase):
             app_paths=self.app_paths
         )
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        pygame.quit()
-        
-        shutil.rmtree(self.temp_data_dir)
-        shutil.rmtree(self.temp_games_dir)
-
-    # FIXME: Mock issue        
-    def disabled_test_menu_to_game_list_transition(self):
+    @unittest.skip("FIXME: Mock issue")
+    def test_menu_to_game_list_transition(self):
         # Verify initial state is menu
         self.assertIsInstance(self.state_manager.current_state, MenuState)
         
@@ -85,22 +65,23 @@ class TestStateTransitionFlow(unittest.TestCase):
         self.state_manager.change_state('game_list')
         self.assertIsInstance(self.state_manager.current_state, GameListState)
 
-    def test_menu_to_download_transition(self):
+    def test_menu_transitions(self):
         # Configure mock game library to return an empty list
         self.mock_game_library.get_available_games.return_value = []
         self.mock_game_library.get_enhanced_game_list.return_value = []
         
-        # Test changing state to download
-        self.state_manager.change_state('download')
-        self.assertIsInstance(self.state_manager.current_state, DownloadState)
-
-    def test_menu_to_settings_transition(self):
-        # Test changing state to settings
-        self.state_manager.change_state('settings')
-        self.assertIsInstance(self.state_manager.current_state, SettingsState)
-
-    # FIXME: Mock issue
-    def disabled_test_state_stack_operations(self):
+        # Share one state manager across targets, returning to the menu each time
+        for target, state_class in (('download', DownloadState),
+                                    ('settings', SettingsState)):
+            with self.subTest(target=target):
+                self.state_manager.change_state('menu')
+                self.assertIsInstance(self.state_manager.current_state, MenuState)
+                
+                self.state_manager.change_state(target)
+                self.assertIsInstance(self.state_manager.current_state, state_class)
+
+    @unittest.skip("FIXME: Mock issue")
+    def test_state_stack_operations(self):
         # Verify initial state is menu
         self.assertIsInstance(self.state_manager.current_state, MenuState)
         
@@ -120,13 +101,15 @@ class TestStateTransitionFlow(unittest.TestCase):
         
         self.assertIsInstance(self.state_manager.current_state, GameListState)
         
-        # Mock the on_exit method to prevent issues
-        with patch.object(self.state_manager.current_state, 'on_exit') as mock_on_exit:
-            mock_on_exit.return_value = None
-            
+        # Stub out on_exit on the instance to prevent issues
+        game_list_state = self.state_manager.current_state
+        game_list_state.on_exit = lambda: None
+        try:
             # Pop back to menu state
             self.state_manager.pop_state()
             self.assertIsInstance(self.state_manager.current_state, MenuState)
+        finally:
+            del game_list_state.on_exit
 
 
 if __name__ == '__main__':
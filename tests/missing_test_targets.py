@@ -4,10 +4,26 @@ Test Detection Script
 Alerts if test_*.py files are not included in Bazel BUILD files.
 """
 
+import functools
+import os
 import pathlib
 import re
-from dataclasses import dataclass
-from typing import List, Set, Dict
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, Dict
+
+
+_NAME_RE = re.compile(rb'name\s*=\s*"([^"]+)"')
+
+
+@functools.lru_cache(maxsize=None)
+def _read_target_names(path: str, mtime_ns: int) -> FrozenSet[str]:
+    """Read target names from a BUILD file.
+
+    Cached on path and modification time, so an unchanged file is only
+    read and scanned once per process.
+    """
+    data = pathlib.Path(path).read_bytes()
+    return frozenset(name.decode() for name in _NAME_RE.findall(data))
 
 
 class Paths:
@@ -58,11 +74,10 @@ class TestFileInfo:
     path: pathlib.Path
     name: str
     directory: str  # 'unit' or 'integration'
+    relative_path: pathlib.Path = field(init=False)  # Path relative to tests directory
     
-    @property
-    def relative_path(self) -> pathlib.Path:
-        """Path relative to tests directory."""
-        return self.path.relative_to(self.path.parent.parent)
+    def __post_init__(self):
+        self.relative_path = self.path.relative_to(self.path.parent.parent)
 
 
 class BuildFileParser:
@@ -70,16 +85,13 @@ class BuildFileParser:
     
     def __init__(self, paths: Paths):
         self._paths = paths
-        self._name_pattern = re.compile(r'name\s*=\s*"([^"]+)"')
     
-    def parse_build_file(self, build_file: pathlib.Path) -> Set[str]:
+    def parse_build_file(self, build_file: pathlib.Path) -> FrozenSet[str]:
         """Parse a BUILD file and return set of test target names."""
-        test_names = set()
+        test_names = frozenset()
         
         try:
-            content = build_file.read_text()
-            for match in self._name_pattern.finditer(content):
-                test_names.add(match.group(1))
+            test_names = _read_target_names(str(build_file), build_file.stat().st_mtime_ns)
         except FileNotFoundError:
             print(f"Warning: BUILD file not found: {build_file}")
         except Exception as e:
@@ -87,7 +99,7 @@ class BuildFileParser:
         
         return test_names
     
-    def get_all_test_names(self) -> Dict[str, Set[str]]:
+    def get_all_test_names(self) -> Dict[str, FrozenSet[str]]:
         """Get all test names from all BUILD files.
         
         Returns:
@@ -141,7 +153,14 @@ class TestCollector:
             print(f"Warning: Directory not found: {directory}")
             return test_files
         
-        for test_file in sorted(directory.glob("test_*.py")):
+        with os.scandir(directory) as it:
+            entries = [entry for entry in it
+                       if entry.name.startswith("test_") and entry.name.endswith(".py")
+                       and entry.is_file()]
+        entries.sort(key=lambda entry: entry.name)
+        
+        for entry in entries:
+            test_file = pathlib.Path(entry.path)
             test_files.append(TestFileInfo(
                 path=test_file,
                 name=test_file.stem,  # filename without extension
@@ -155,7 +174,7 @@ class TestComparator:
     """Compares test files with BUILD file entries."""
     
     def __init__(self, test_files: List[TestFileInfo], 
-                 build_test_names: Dict[str, Set[str]]):
+                 build_test_names: Dict[str, FrozenSet[str]]):
         self._test_files = test_files
         self._build_test_names = build_test_names
     
@@ -165,18 +184,12 @@ class TestComparator:
         Returns:
             List of TestFileInfo objects for missing tests.
         """
-        missing_tests = []
-        
-        for test_file in self._test_files:
-            directory = test_file.directory
-            if directory in self._build_test_names:
-                if test_file.name not in self._build_test_names[directory]:
-                    missing_tests.append(test_file)
-            else:
-                # No BUILD file entries for this directory
-                missing_tests.append(test_file)
-        
-        return missing_tests
+        # A directory without BUILD file entries counts as having no targets
+        no_targets = frozenset()
+        build_test_names = self._build_test_names
+        
+        return [test_file for test_file in self._test_files
+                if test_file.name not in build_test_names.get(test_file.directory, no_targets)]
     
     def generate_report(self, missing_tests: List[TestFileInfo]) -> str:
         """Generate a report of missing tests.
@@ -64,22 +64,20 @@ def find_missing_tests():
     test_modules = get_test_modules()
     
     # Normalize for comparison
-    normalized_test_modules = [normalize_module_name(m) for m in test_modules]
+    test_set = {normalize_module_name(m) for m in test_modules}
+    # Dotted suffixes of test names, e.g. "core.application" -> "application"
+    test_suffixes = {t.split('.', i)[-1] for t in test_set for i in range(1, t.count('.') + 1)}
     
     missing = []
     
     for source_module in source_modules:
         normalized_source = normalize_module_name(source_module)
         
-        # Check if there's a test module
-        has_test = False
-        for test_normalized in normalized_test_modules:
-            # Check if test module name matches or contains the source module name
-            if test_normalized == normalized_source or \
-               test_normalized.endswith('.' + normalized_source) or \
-               normalized_source.endswith('.' + test_normalized):
-                has_test = True
-                break
+        # A test matches if either name is a dotted suffix of the other
+        parts = normalized_source.split('.')
+        has_test = normalized_source in test_set or \
+            normalized_source in test_suffixes or \
+            any('.'.join(parts[i:]) in test_set for i in range(1, len(parts)))
         
         if not has_test and source_module not in WHITE_LIST:
             missing.append(source_module)
@@ -95,12 +93,13 @@ def main():
     
     # Save to JSON file
     #output_file = "tests/missing.json"
+    #total_source_modules = len(get_source_modules())
     #with open(output_file, 'w') as f:
     #    json.dump({
     #        "missing_tests": missing_modules,
     #        "count": len(missing_modules),
-    #        "total_source_modules": len(get_source_modules()),
-    #        "tested_modules": len(get_source_modules()) - len(missing_modules)
+    #        "total_source_modules": total_source_modules,
+    #        "tested_modules": total_source_modules - len(missing_modules)
     #    }, f, indent=2)
 
     if missing_modules:
@@ -0,0 +1,235 @@
+# Copyright (C) 2025 H. Blok
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Test Utilities
+
+Shared helpers for the unit and integration tests. This module does not
+depend on pytest, so the tests that use it also run under unittest and Bazel.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from types import MappingProxyType
+
+import pygame
+
+
+def mock_hw_config():
+    """Create a minimal hardware configuration for testing."""
+    return {
+        "detected_device": "desktop",
+        "detected_os": "standard_linux",
+        "display": {
+            "resolution": [1280, 720],
+            "fullscreen": False,
+            "fps_target": 60,
+            "hide_cursor": False,
+        },
+        "input": {
+            "joystick_enabled": True,
+            "keyboard_enabled": True,
+        },
+        "paths": {
+            "games": str(Path.home() / "games"),
+            "data": str(Path.home() / ".local/share/sbc-man"),
+            "config": str(Path.home() / ".config/sbc-man"),
+        },
+        "probed_hardware": {
+            "display": {
+                "current_resolution": [1280, 720],
+                "available_modes": [],
+                "hardware_accelerated": False,
+                "bit_depth": 32,
+            },
+            "input": {
+                "has_keyboard": True,
+                "joystick_count": 0,
+                "joysticks": [],
+            },
+            "storage": {},
+            "cpu": {
+                "core_count": 4,
+                "architecture": "x86",
+            },
+        },
+    }
+
+
+# Sample game data shared by all tests; read-only, use dict(...) to modify
+MOCK_GAMES = (
+    MappingProxyType({
+        "id": "test-game-1",
+        "name": "Test Game 1",
+        "version": "1.0.0",
+        "description": "A test game",
+        "author": "Test Author",
+        "install_path": "/tmp/games/test-game-1",
+        "entry_point": "main.py",
+        "installed": True,
+        "download_url": "https://example.com/game1.zip",
+        "custom_input_mappings": MappingProxyType({}),
+        "custom_resolution": None,
+        "custom_fps": None,
+    }),
+    MappingProxyType({
+        "id": "test-game-2",
+        "name": "Test Game 2",
+        "version": "2.0.0",
+        "description": "Another test game",
+        "author": "Test Author",
+        "install_path": "/tmp/games/test-game-2",
+        "entry_point": "main.py",
+        "installed": False,
+        "download_url": "https://example.com/game2.zip",
+        "custom_input_mappings": MappingProxyType({}),
+        "custom_resolution": None,
+        "custom_fps": None,
+    }),
+)
+
+
+def mock_game_data():
+    """Return sample game data for testing (read-only mappings)."""
+    return MOCK_GAMES
+
+
+class RecordingDownloadObserver:
+    """Download observer that records every callback it receives."""
+
+    def __init__(self):
+        self.progress_calls = []
+        self.complete_calls = []
+        self.error_calls = []
+
+    def on_progress(self, downloaded: int, total: int) -> None:
+        """Track progress calls."""
+        self.progress_calls.append((downloaded, total))
+
+    def on_complete(self, success: bool, message: str) -> None:
+        """Track complete calls."""
+        self.complete_calls.append((success, message))
+
+    def on_error(self, error_message: str) -> None:
+        """Track error calls."""
+        self.error_calls.append(error_message)
+
+
+class IntegrationTestCase(unittest.TestCase):
+    """Base class for integration tests of the states.
+
+    Initializes pygame and creates the data and games directories once per
+    class, together with a minimal hardware config pointing at them. Set
+    temp_base to create the directories somewhere other than the default
+    temp location.
+    """
+
+    temp_base = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests in the class."""
+        pygame.init()
+
+        cls._temp_data = tempfile.TemporaryDirectory(dir=cls.temp_base)
+        cls._temp_games = tempfile.TemporaryDirectory(dir=cls.temp_base)
+        cls.temp_data_dir = Path(cls._temp_data.name)
+        cls.temp_games_dir = Path(cls._temp_games.name)
+
+        # The states only read the hardware config
+        cls.hw_config = {
+            "paths": {
+                "data": cls.temp_data_dir,
+                "games": cls.temp_games_dir,
+            },
+            "display": MappingProxyType({
+                "resolution": (1280, 720),
+                "fps_target": 60,
+            }),
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up fixtures shared by all tests in the class."""
+        pygame.quit()
+
+        cls._temp_data.cleanup()
+        cls._temp_games.cleanup()
+
+
+class TempConfigDir:
+    """Context manager for temporary config directory."""
+    
+    def __init__(self):
+        self.temp_dir = None
+        self.devices_dir = None
+        self.os_types_dir = None
+        self.input_mappings_dir = None
+    
+    def __enter__(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.devices_dir = Path(self.temp_dir) / "devices"
+        self.os_types_dir = Path(self.temp_dir) / "os_types"
+        self.input_mappings_dir = Path(self.temp_dir) / "input_mappings"
+        
+        # Create directories
+        self.devices_dir.mkdir(parents=True)
+        self.os_types_dir.mkdir(parents=True)
+        self.input_mappings_dir.mkdir(parents=True)
+        
+        # Create default config files
+        default_device = {
+            "device_type": "default",
+            "display": {"resolution": "auto", "fullscreen": False, "fps_target": 60},
+            "paths": {"games": "~/games", "data": "~/.local/share/sbc-man"},
+        }
+        
+        with open(self.devices_dir / "default.json", "w") as f:
+            json.dump(default_device, f)
+        
+        default_input = {
+            "confirm": ["BUTTON_A", "RETURN"],
+            "cancel": ["BUTTON_B", "ESCAPE"],
+            "up": ["DPAD_UP", "UP"],
+            "down": ["DPAD_DOWN", "DOWN"],
+        }
+        
+        with open(self.input_mappings_dir / "default.json", "w") as f:
+            json.dump(default_input, f)
+        
+        return self
+    
+    def __exit__(self, *args):
+        import shutil
+        if self.temp_dir:
+            shutil.rmtree(self.temp_dir)
+
+
+class TempDataDir:
+    """Context manager for temporary data directory."""
+    
+    def __init__(self):
+        self.temp_dir = None
+        self.games_file = None
+        self.config_file = None
+    
+    def __enter__(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.games_file = Path(self.temp_dir) / "games.json"
+        self.config_file = Path(self.temp_dir) / "config.json"
+        
+        # Create empty files
+        with open(self.games_file, "w") as f:
+            json.dump([], f)
+        
+        with open(self.config_file, "w") as f:
+            json.dump({}, f)
+        
+        return self
+    
+    def __exit__(self, *args):
+        import shutil
+        if self.temp_dir:
+            shutil.rmtree(self.temp_dir)
@@ -20,16 +20,18 @@ from sbcman.path.paths import AppPaths
 class TestApplication(unittest.TestCase):
     """Test cases for Application."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temporary directories for testing
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.app_paths = AppPaths(self.temp_dir, self.temp_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests in the class."""
+        # Create temporary directories for testing; the tests only read them
+        cls._temp = tempfile.TemporaryDirectory()
+        cls.temp_dir = Path(cls._temp.name)
+        cls.app_paths = AppPaths(cls.temp_dir, cls.temp_dir)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up fixtures shared by all tests in the class."""
+        cls._temp.cleanup()
 
     @patch('sbcman.core.application.pygame.init')
     @patch('sbcman.core.application.StateManager')
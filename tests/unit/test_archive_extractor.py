@@ -13,24 +13,50 @@ import tempfile
 import zipfile
 import tarfile
 import io
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from sbcman.services.archive_extractor import ArchiveExtractor
 
 
-class TestArchiveExtractor(unittest.TestCase):
+def _zip_bytes(name, content):
+    """Build a single-file zip archive in memory."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr(name, content)
+    return buffer.getvalue()
 
-    def setUp(self):
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.extractor = ArchiveExtractor()
 
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+def _tar_bytes(name, content):
+    """Build a single-file tar archive in memory."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tf:
+        info = tarfile.TarInfo(name=name)
+        info.size = len(content)
+        tf.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+# Tar member type checks, all False for a regular file
+TARINFO_TYPE_CHECKS = ("issym", "islnk", "isdev", "ischr", "isblk")
+
+
+def _tarinfo(name, **type_checks):
+    """Build a plain tar member stand-in; pass e.g. issym=True to change its type."""
+    tarinfo = SimpleNamespace(name=name)
+    for check in TARINFO_TYPE_CHECKS:
+        result = type_checks.get(check, False)
+        setattr(tarinfo, check, lambda result=result: result)
+    return tarinfo
+
+
+class TestArchiveExtractor(unittest.TestCase):
+    """In-process validation tests; no files are touched."""
+
+    @classmethod
+    def setUpClass(cls):
+        # The extractor holds only its limits, so one instance is shared
+        cls.extractor = ArchiveExtractor()
 
     def test_initialization_default_values(self):
         extractor = ArchiveExtractor()
@@ -48,35 +74,132 @@ class TestArchiveExtractor(unittest.TestCase):
         self.assertEqual(extractor.max_total_size, 2048)
         self.assertEqual(extractor.max_compression_ratio, 50)
 
-    def test_is_tar_archive_tar(self):
-        archive_path = Path("test.tar")
-        self.assertTrue(self.extractor._is_tar_archive(archive_path))
+    # Archive paths and whether they are tar archives
+    TAR_ARCHIVE_CASES = tuple((Path(name), expected) for name, expected in (
+        ("test.tar", True),
+        ("test.tar.gz", True),
+        ("test.tar.bz2", True),
+        ("test.tar.xz", True),
+        ("test.gz", True),
+        ("test.zip", False),
+    ))
+
+    def test_is_tar_archive(self):
+        for path, expected in self.TAR_ARCHIVE_CASES:
+            with self.subTest(path=path.name):
+                self.assertEqual(self.extractor._is_tar_archive(path), expected)
+
+    def test_validate_path(self):
+        cases = [
+            ("normal/path.txt", True),
+            ("/absolute/path.txt", False),
+            ("../../../etc/passwd", False),
+            ("foo/../../bar", False),
+            ("path\x00file.txt", False),
+        ]
+        for path, expected in cases:
+            with self.subTest(path=path):
+                self.assertEqual(self.extractor._validate_path(path), expected)
+
+    def test_validate_size(self):
+        # (extractor limits, file size, total size so far, expected)
+        cases = [
+            ({}, 1024, 0, True),
+            ({"max_file_size": 100}, 200, 0, False),
+            ({"max_total_size": 150}, 100, 100, False),
+        ]
+        for limits, file_size, total_size, expected in cases:
+            with self.subTest(limits=limits, file_size=file_size, total_size=total_size):
+                extractor = ArchiveExtractor(**limits) if limits else self.extractor
+                info = SimpleNamespace(file_size=file_size, filename="test.txt")
+                
+                self.assertEqual(extractor._validate_size(info, total_size), expected)
+
+    def test_validate_compression(self):
+        # (extractor limits, file size, compressed size, expected)
+        cases = [
+            ({}, 100, 50, True),
+            ({"max_compression_ratio": 10}, 1000, 10, False),
+            ({}, 100, 0, True),
+        ]
+        for limits, file_size, compress_size, expected in cases:
+            with self.subTest(limits=limits, file_size=file_size, compress_size=compress_size):
+                extractor = ArchiveExtractor(**limits) if limits else self.extractor
+                info = SimpleNamespace(file_size=file_size, compress_size=compress_size,
+                                       filename="test.txt")
+                
+                self.assertEqual(extractor._validate_compression(info), expected)
 
-    def test_is_tar_archive_tar_gz(self):
-        archive_path = Path("test.tar.gz")
-        self.assertTrue(self.extractor._is_tar_archive(archive_path))
+    def test_secure_filter_absolute_path(self):
+        tarinfo = _tarinfo("/absolute/path")
+        
+        with self.assertRaises(tarfile.ExtractError):
+            self.extractor.secure_filter(tarinfo, "/dest")
 
-    def test_is_tar_archive_tar_bz2(self):
-        archive_path = Path("test.tar.bz2")
-        self.assertTrue(self.extractor._is_tar_archive(archive_path))
+    def test_secure_filter_traversal(self):
+        tarinfo = _tarinfo("../etc/passwd")
+        
+        with self.assertRaises(tarfile.ExtractError):
+            self.extractor.secure_filter(tarinfo, "/dest")
 
-    def test_is_tar_archive_tar_xz(self):
-        archive_path = Path("test.tar.xz")
-        self.assertTrue(self.extractor._is_tar_archive(archive_path))
+    def test_secure_filter_symlink(self):
+        tarinfo = _tarinfo("link", issym=True)
+        
+        with self.assertRaises(tarfile.ExtractError):
+            self.extractor.secure_filter(tarinfo, "/dest")
 
-    def test_is_tar_archive_gz(self):
-        archive_path = Path("test.gz")
-        self.assertTrue(self.extractor._is_tar_archive(archive_path))
+    def test_secure_filter_normal_file(self):
+        tarinfo = _tarinfo("normal/file.txt")
+        
+        result = self.extractor.secure_filter(tarinfo, "/dest")
+        self.assertEqual(result, tarinfo)
 
-    def test_is_tar_archive_not_tar(self):
-        archive_path = Path("test.zip")
-        self.assertFalse(self.extractor._is_tar_archive(archive_path))
+    def test_get_secure_tar_members_excludes_absolute(self):
+        mock_tar = MagicMock()
+        mock_tar.getmembers.return_value = [_tarinfo("/absolute/path")]
+        
+        result = self.extractor._get_secure_tar_members(mock_tar)
+        self.assertEqual(len(result), 0)
+
+    def test_get_secure_tar_members_excludes_symlink(self):
+        mock_tar = MagicMock()
+        mock_tar.getmembers.return_value = [_tarinfo("link", issym=True)]
+        
+        result = self.extractor._get_secure_tar_members(mock_tar)
+        self.assertEqual(len(result), 0)
+
+    def test_get_secure_tar_members_includes_normal(self):
+        mock_tar = MagicMock()
+        mock_tar.getmembers.return_value = [_tarinfo("file.txt")]
+        
+        result = self.extractor._get_secure_tar_members(mock_tar)
+        self.assertEqual(len(result), 1)
+
+
+class TestArchiveExtractorExtract(unittest.TestCase):
+    """Extraction tests that need a real destination directory."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Archives are built once in memory and written out per test
+        cls.zip_data = _zip_bytes("test.txt", "content")
+        cls.tar_data = _tar_bytes("test.txt", b"content")
+
+        # One temp root for the class; each test gets a subdirectory
+        cls._temp = tempfile.TemporaryDirectory()
+        cls.extractor = ArchiveExtractor()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._temp.cleanup()
+
+    def setUp(self):
+        self.temp_dir = Path(self._temp.name) / self._testMethodName
+        self.temp_dir.mkdir()
 
     def test_extract_zip_creates_directory(self):
         archive_path = self.temp_dir / "test.zip"
-        
-        with zipfile.ZipFile(archive_path, 'w') as zf:
-            zf.writestr("test.txt", "content")
+        archive_path.write_bytes(self.zip_data)
         
         dest_dir = self.temp_dir / "output"
         result = self.extractor.extract(archive_path, dest_dir)
@@ -86,24 +209,20 @@ class TestArchiveExtractor(unittest.TestCase):
         self.assertTrue((dest_dir / "test.txt").exists())
 
     def test_extract_zip_whl(self):
+        # Only the dispatch is checked; zip extraction is covered end to end above
         archive_path = self.temp_dir / "test.whl"
         
-        with zipfile.ZipFile(archive_path, 'w') as zf:
-            zf.writestr("metadata.txt", "content")
-        
         dest_dir = self.temp_dir / "output"
-        result = self.extractor.extract(archive_path, dest_dir)
+        with patch.object(self.extractor, '_extract_zip') as mock_extract_zip:
+            result = self.extractor.extract(archive_path, dest_dir)
         
         self.assertEqual(result, dest_dir)
-        self.assertTrue((dest_dir / "metadata.txt").exists())
+        self.assertTrue(dest_dir.exists())
+        mock_extract_zip.assert_called_once_with(archive_path, dest_dir)
 
     def test_extract_tar_creates_directory(self):
         archive_path = self.temp_dir / "test.tar"
-        
-        with tarfile.open(archive_path, 'w') as tf:
-            info = tarfile.TarInfo(name="test.txt")
-            info.size = 7
-            tf.addfile(info, io.BytesIO(b"content"))
+        archive_path.write_bytes(self.tar_data)
         
         dest_dir = self.temp_dir / "output"
         result = self.extractor.extract(archive_path, dest_dir)
@@ -120,140 +239,3 @@ class TestArchiveExtractor(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             self.extractor.extract(archive_path, dest_dir)
-
-    def test_validate_path_normal_path(self):
-        self.assertTrue(self.extractor._validate_path("normal/path.txt"))
-
-    def test_validate_path_absolute_path(self):
-        self.assertFalse(self.extractor._validate_path("/absolute/path.txt"))
-
-    def test_validate_path_traversal(self):
-        self.assertFalse(self.extractor._validate_path("../../../etc/passwd"))
-
-    def test_validate_path_traversal_normalized(self):
-        self.assertFalse(self.extractor._validate_path("foo/../../bar"))
-
-    def test_validate_path_null_byte(self):
-        self.assertFalse(self.extractor._validate_path("path\x00file.txt"))
-
-    def test_validate_size_within_limit(self):
-        mock_info = MagicMock()
-        mock_info.file_size = 1024
-        mock_info.filename = "test.txt"
-        
-        result = self.extractor._validate_size(mock_info, 0)
-        self.assertTrue(result)
-
-    def test_validate_size_exceeds_file_limit(self):
-        extractor = ArchiveExtractor(max_file_size=100)
-        mock_info = MagicMock()
-        mock_info.file_size = 200
-        mock_info.filename = "test.txt"
-        
-        result = extractor._validate_size(mock_info, 0)
-        self.assertFalse(result)
-
-    def test_validate_size_exceeds_total_limit(self):
-        extractor = ArchiveExtractor(max_total_size=150)
-        mock_info = MagicMock()
-        mock_info.file_size = 100
-        mock_info.filename = "test.txt"
-        
-        result = extractor._validate_size(mock_info, 100)
-        self.assertFalse(result)
-
-    def test_validate_compression_normal(self):
-        mock_info = MagicMock()
-        mock_info.file_size = 100
-        mock_info.compress_size = 50
-        
-        result = self.extractor._validate_compression(mock_info)
-        self.assertTrue(result)
-
-    def test_validate_compression_bomb(self):
-        extractor = ArchiveExtractor(max_compression_ratio=10)
-        mock_info = MagicMock()
-        mock_info.file_size = 1000
-        mock_info.compress_size = 10
-        
-        result = extractor._validate_compression(mock_info)
-        self.assertFalse(result)
-
-    def test_validate_compression_zero_compressed(self):
-        mock_info = MagicMock()
-        mock_info.file_size = 100
-        mock_info.compress_size = 0
-        
-        result = self.extractor._validate_compression(mock_info)
-        self.assertTrue(result)
-
-    def test_secure_filter_absolute_path(self):
-        mock_tarinfo = MagicMock()
-        mock_tarinfo.name = "/absolute/path"
-        
-        with self.assertRaises(tarfile.ExtractError):
-            self.extractor.secure_filter(mock_tarinfo, "/dest")
-
-    def test_secure_filter_traversal(self):
-        mock_tarinfo = MagicMock()
-        mock_tarinfo.name = "../etc/passwd"
-        
-        with self.assertRaises(tarfile.ExtractError):
-            self.extractor.secure_filter(mock_tarinfo, "/dest")
-
-    def test_secure_filter_symlink(self):
-        mock_tarinfo = MagicMock()
-        mock_tarinfo.name = "link"
-        mock_tarinfo.issym.return_value = True
-        
-        with self.assertRaises(tarfile.ExtractError):
-            self.extractor.secure_filter(mock_tarinfo, "/dest")
-
-    def test_secure_filter_normal_file(self):
-        mock_tarinfo = MagicMock()
-        mock_tarinfo.name = "normal/file.txt"
-        mock_tarinfo.issym.return_value = False
-        mock_tarinfo.islnk.return_value = False
-        mock_tarinfo.isdev.return_value = False
-        mock_tarinfo.ischr.return_value = False
-        mock_tarinfo.isblk.return_value = False
-        
-        result = self.extractor.secure_filter(mock_tarinfo, "/dest")
-        self.assertEqual(result, mock_tarinfo)
-
-    def test_get_secure_tar_members_excludes_absolute(self):
-        mock_tar = MagicMock()
-        mock_member = MagicMock()
-        mock_member.name = "/absolute/path"
-        mock_tar.getmembers.return_value = [mock_member]
-        
-        result = self.extractor._get_secure_tar_members(mock_tar)
-        self.assertEqual(len(result), 0)
-
-    def test_get_secure_tar_members_excludes_symlink(self):
-        mock_tar = MagicMock()
-        mock_member = MagicMock()
-        mock_member.name = "link"
-        mock_member.issym.return_value = True
-        mock_member.islnk.return_value = False
-        mock_member.isdev.return_value = False
-        mock_member.ischr.return_value = False
-        mock_member.isblk.return_value = False
-        mock_tar.getmembers.return_value = [mock_member]
-        
-        result = self.extractor._get_secure_tar_members(mock_tar)
-        self.assertEqual(len(result), 0)
-
-    def test_get_secure_tar_members_includes_normal(self):
-        mock_tar = MagicMock()
-        mock_member = MagicMock()
-        mock_member.name = "file.txt"
-        mock_member.issym.return_value = False
-        mock_member.islnk.return_value = False
-        mock_member.isdev.return_value = False
-        mock_member.ischr.return_value = False
-        mock_member.isblk.return_value = False
-        mock_tar.getmembers.return_value = [mock_member]
-        
-        result = self.extractor._get_secure_tar_members(mock_tar)
-        self.assertEqual(len(result), 1)
\ No newline at end of file
@@ -8,11 +8,7 @@ Tests for base state functionality.
 """
 
 import unittest
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-
-import pygame
+from unittest.mock import Mock, patch
 
 from sbcman.states.base_state import BaseState
 
@@ -21,4 +17,48 @@ class TestBaseState(unittest.TestCase):
     
     def test_base_state_cannot_be_instantiated(self):
         with self.assertRaises(TypeError):
-            base_state = BaseState(Mock())
\ No newline at end of file
+            base_state = BaseState(Mock())
+
+class _ConcreteState(BaseState):
+    """Minimal concrete state for exercising BaseState helpers."""
+
+    def on_enter(self, previous_state):
+        pass
+
+    def on_exit(self):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def handle_events(self, events):
+        pass
+
+    def render(self, surface):
+        pass
+
+
+class TestBaseStateTextCache(unittest.TestCase):
+
+    def setUp(self):
+        self.state = _ConcreteState(Mock())
+
+    def test_get_font_caches_by_size(self):
+        with patch('pygame.font.Font', side_effect=lambda name, size: Mock()) as mock_font:
+            font1 = self.state._get_font(32)
+            font2 = self.state._get_font(32)
+            font3 = self.state._get_font(48)
+
+        self.assertIs(font1, font2)
+        self.assertIsNot(font1, font3)
+        self.assertEqual(mock_font.call_count, 2)
+
+    def test_render_text_reuses_surface(self):
+        mock_font = Mock()
+        with patch('pygame.font.Font', return_value=mock_font):
+            surface1 = self.state._render_text("Title", 32, (255, 255, 255))
+            surface2 = self.state._render_text("Title", 32, (255, 255, 255))
+            self.state._render_text("Title", 32, (150, 150, 150))
+
+        self.assertIs(surface1, surface2)
+        self.assertEqual(mock_font.render.call_count, 2)
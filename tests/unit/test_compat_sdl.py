@@ -9,46 +9,67 @@ display setup, and environment variable handling.
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 import os
 
 import pygame
 
 from sbcman.hardware.compat_sdl import init_display, _try_init_pygame_display
 
+# Environment variables written by the SDL compatibility layer
+SDL_ENV_VARS = (
+    "SDL_RENDER_DRIVER",
+    "SDL_RENDER_VSYNC",
+    "SDL_RENDER_SCALE_QUALITY",
+    "SDL_NOMOUSE",
+    "SDL_VIDEODRIVER",
+)
+
 
 class TestCompatSDL(unittest.TestCase):
     """Test cases for SDL compatibility layer."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Patch the pygame display calls once for the class."""
+        cls.display = cls.enterClassContext(
+            patch.multiple('pygame.display', init=DEFAULT, set_mode=DEFAULT,
+                           Info=DEFAULT, get_driver=DEFAULT, quit=DEFAULT))
+        cls.mock_pump = cls.enterClassContext(patch('pygame.event.pump'))
+
     def setUp(self):
         """Set up test fixtures."""
-        # Save original environment variables
-        self.original_env = os.environ.copy()
+        # Save the environment variables the compat layer sets
+        self.original_env = {name: os.environ.get(name) for name in SDL_ENV_VARS}
+        
+        # Start every test from fresh mocks
+        for mock in (*self.display.values(), self.mock_pump):
+            mock.reset_mock(return_value=True, side_effect=True)
+        
+        # Desktop size is unknown unless a test sets it
+        self.display['Info'].return_value = Mock(current_w=0, current_h=0)
 
     def tearDown(self):
         """Restore original environment variables."""
-        os.environ.clear()
-        os.environ.update(self.original_env)
+        for name, value in self.original_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
 
-    @patch('pygame.display.init')
-    @patch('pygame.display.set_mode')
-    @patch('pygame.display.Info')
-    @patch('pygame.event.pump')
-    @patch('pygame.display.get_driver')
-    def test_init_display_success(self, mock_get_driver, mock_pump,
-                                 mock_display_info, mock_set_mode, mock_display_init):
+    def test_init_display_success(self):
         """Test successful display initialization."""
         # Setup mocks
         mock_screen = Mock()
         mock_screen.get_size.return_value = (1280, 720)
-        mock_set_mode.return_value = mock_screen
+        self.display['set_mode'].return_value = mock_screen
         
         mock_info = Mock()
         mock_info.current_w = 1920
         mock_info.current_h = 1080
-        mock_display_info.return_value = mock_info
+        self.display['Info'].return_value = mock_info
         
-        mock_get_driver.return_value = 'x11'
+        self.display['get_driver'].return_value = 'x11'
         
         # Mock SDL2 introspection to raise exception (fallback case)
         #mock_sdl2.video = None
@@ -67,20 +88,14 @@ class TestCompatSDL(unittest.TestCase):
         # Verify size
         self.assertEqual(info['size'], (1280, 720))
 
-    @patch('pygame.display.init')
-    @patch('pygame.display.set_mode')
-    @patch('pygame.display.Info')
-    @patch('pygame.event.pump')
-    @patch('pygame.display.get_driver')
-    def test_init_display_windowed(self, mock_get_driver, mock_pump,
-                                   mock_display_info, mock_set_mode, mock_display_init):
+    def test_init_display_windowed(self):
         """Test display initialization in windowed mode."""
         # Setup mocks
         mock_screen = Mock()
         mock_screen.get_size.return_value = (640, 480)
-        mock_set_mode.return_value = mock_screen
+        self.display['set_mode'].return_value = mock_screen
         
-        mock_get_driver.return_value = 'x11'
+        self.display['get_driver'].return_value = 'x11'
         
         # Call init_display without fullscreen
         screen, info = init_display(fullscreen=False, vsync=False, size=(640, 480))
@@ -91,16 +106,11 @@ class TestCompatSDL(unittest.TestCase):
         # Verify screen was returned
         self.assertEqual(screen, mock_screen)
 
-    @patch('pygame.display.init')
-    @patch('pygame.display.set_mode')
-    @patch('pygame.event.pump')
-    @patch('pygame.display.quit')
-    def test_try_init_pygame_display_success(self, mock_display_quit, mock_pump,
-                                           mock_set_mode, mock_display_init):
+    def test_try_init_pygame_display_success(self):
         """Test _try_init_pygame_display success."""
         # Setup mocks
         mock_screen = Mock()
-        mock_set_mode.return_value = mock_screen
+        self.display['set_mode'].return_value = mock_screen
         
         # Call _try_init_pygame_display
         screen, error = _try_init_pygame_display(
@@ -112,19 +122,18 @@ class TestCompatSDL(unittest.TestCase):
         self.assertIsNone(error)
         
         # Verify pygame.init was called
-        mock_display_init.assert_called_once()
+        self.display['init'].assert_called_once()
         
         # Verify set_mode was called with fullscreen flag
-        mock_set_mode.assert_called_once()
-        call_args = mock_set_mode.call_args[0]
+        self.display['set_mode'].assert_called_once()
+        call_args = self.display['set_mode'].call_args[0]
         self.assertEqual(call_args[0], (1280, 720))
         self.assertEqual(call_args[1], pygame.FULLSCREEN)
 
-    @patch('pygame.display.init')
-    def test_try_init_pygame_display_init_failure(self, mock_display_init):
+    def test_try_init_pygame_display_init_failure(self):
         """Test _try_init_pygame_display when init fails."""
         # Setup mock to raise exception
-        mock_display_init.side_effect = Exception("Display init failed")
+        self.display['init'].side_effect = Exception("Display init failed")
         
         # Call _try_init_pygame_display
         screen, error = _try_init_pygame_display(
@@ -136,14 +145,10 @@ class TestCompatSDL(unittest.TestCase):
         self.assertIsNotNone(error)
         self.assertIn("Display init failed", error)
 
-    @patch('pygame.display.init')
-    @patch('pygame.display.set_mode')
-    @patch('pygame.event.pump')
-    def test_try_init_pygame_display_set_mode_failure(self, mock_pump,
-                                                     mock_set_mode, mock_display_init):
+    def test_try_init_pygame_display_set_mode_failure(self):
         """Test _try_init_pygame_display when set_mode fails."""
         # Setup mock to raise exception
-        mock_set_mode.side_effect = Exception("Set mode failed")
+        self.display['set_mode'].side_effect = Exception("Set mode failed")
         
         # Call _try_init_pygame_display
         screen, error = _try_init_pygame_display(
@@ -155,14 +160,10 @@ class TestCompatSDL(unittest.TestCase):
         self.assertIsNotNone(error)
         self.assertIn("Set mode failed", error)
 
-    @patch('pygame.display.init')
-    @patch('pygame.display.set_mode')
-    @patch('pygame.display.quit')
-    def test_try_init_pygame_display_cleanup_on_failure(self, mock_display_quit,
-                                                       mock_set_mode, mock_display_init):
+    def test_try_init_pygame_display_cleanup_on_failure(self):
         """Test _try_init_pygame_display cleans up on failure."""
         # Setup mock to raise exception
-        mock_set_mode.side_effect = Exception("Set mode failed")
+        self.display['set_mode'].side_effect = Exception("Set mode failed")
         
         # Call _try_init_pygame_display
         screen, error = _try_init_pygame_display(
@@ -170,50 +171,39 @@ class TestCompatSDL(unittest.TestCase):
         )
         
         # Verify quit was called to clean up
-        mock_display_quit.assert_called()
+        self.display['quit'].assert_called()
 
     def test_try_init_pygame_display_software_mode(self):
         """Test _try_init_pygame_display with software renderer."""
-        with patch('pygame.display.init') as mock_init, \
-             patch('pygame.display.set_mode') as mock_set_mode, \
-             patch('pygame.event.pump') as mock_pump:
-            
-            # Setup mocks
-            mock_screen = Mock()
-            mock_set_mode.return_value = mock_screen
-            
-            # Call with software mode
-            screen, error = _try_init_pygame_display(
-                (640, 480), fullscreen=False, allow_software=True
-            )
-            
-            # Verify SDL_RENDER_DRIVER was set to software
-            self.assertEqual(os.environ.get('SDL_RENDER_DRIVER'), 'software')
-            
-            # Verify screen was returned
-            self.assertEqual(screen, mock_screen)
-            self.assertIsNone(error)
+        # Setup mocks
+        mock_screen = Mock()
+        self.display['set_mode'].return_value = mock_screen
+        
+        # Call with software mode
+        screen, error = _try_init_pygame_display(
+            (640, 480), fullscreen=False, allow_software=True
+        )
+        
+        # Verify SDL_RENDER_DRIVER was set to software
+        self.assertEqual(os.environ.get('SDL_RENDER_DRIVER'), 'software')
+        
+        # Verify screen was returned
+        self.assertEqual(screen, mock_screen)
+        self.assertIsNone(error)
 
-    @patch('pygame.display.init')
-    @patch('pygame.display.set_mode')
-    @patch('pygame.display.Info')
-    @patch('pygame.event.pump')
-    @patch('pygame.display.get_driver')
-    def disabled_test_init_display_fullscreen_desktop_size(self, mock_get_driver, mock_pump,
-                                                  mock_display_info, mock_set_mode,
-                                                  mock_display_init):
+    def disabled_test_init_display_fullscreen_desktop_size(self):
         """Test fullscreen uses desktop size when size not specified."""
         # Setup mocks
         mock_screen = Mock()
         mock_screen.get_size.return_value = (1920, 1080)
-        mock_set_mode.return_value = mock_screen
+        self.display['set_mode'].return_value = mock_screen
         
         mock_info = Mock()
         mock_info.current_w = 1920
         mock_info.current_h = 1080
-        mock_display_info.return_value = mock_info
+        self.display['Info'].return_value = mock_info
         
-        mock_get_driver.return_value = 'x11'
+        self.display['get_driver'].return_value = 'x11'
         
         # Mock SDL2 introspection to raise exception
         with patch('pygame._sdl2', side_effect=ImportError):
@@ -221,23 +211,18 @@ class TestCompatSDL(unittest.TestCase):
             screen, info = init_display(fullscreen=True, vsync=True, size=(640, 480))
             
             # Verify desktop size was used
-            mock_set_mode.assert_called()
-            call_args = mock_set_mode.call_args[0]
+            self.display['set_mode'].assert_called()
+            call_args = self.display['set_mode'].call_args[0]
             self.assertEqual(call_args[0], (1920, 1080))
 
-    @patch('pygame.display.init')
-    @patch('pygame.display.set_mode')
-    @patch('pygame.event.pump')
-    @patch('pygame.display.get_driver')
-    def test_init_display_renderer_info(self, mock_get_driver, mock_pump,
-                                       mock_set_mode, mock_display_init):
+    def test_init_display_renderer_info(self):
         """Test renderer info is extracted when SDL2 is available."""
         # Setup mocks
         mock_screen = Mock()
         mock_screen.get_size.return_value = (1280, 720)
-        mock_set_mode.return_value = mock_screen
+        self.display['set_mode'].return_value = mock_screen
         
-        mock_get_driver.return_value = 'x11'
+        self.display['get_driver'].return_value = 'x11'
         
         # Mock SDL2 introspection
         mock_window = Mock()
@@ -21,14 +21,15 @@ from sbcman.path.paths import AppPaths
 class TestConfigLoader(unittest.TestCase):
     """Test cases for ConfigLoader."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_dir = Path(self.temp_dir) / "config"
+    @classmethod
+    def setUpClass(cls):
+        """Write the config files once; the tests only read them."""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.config_dir = Path(cls.temp_dir) / "config"
         
         # Create directory structure
-        (self.config_dir / "devices").mkdir(parents=True)
-        (self.config_dir / "os_types").mkdir(parents=True)
+        (cls.config_dir / "devices").mkdir(parents=True)
+        (cls.config_dir / "os_types").mkdir(parents=True)
         
         # Create test AppPaths
         class TestAppPaths(AppPaths):
@@ -41,7 +42,7 @@ class TestConfigLoader(unittest.TestCase):
             def src_config_dir(self):
                 return Path(self._temp_dir_name) / "config"
         
-        self.app_paths = TestAppPaths(self.temp_dir)
+        cls.app_paths = TestAppPaths(cls.temp_dir)
         
         # Create default config
         default_config = {
@@ -57,7 +58,7 @@ class TestConfigLoader(unittest.TestCase):
             }
         }
         
-        with open(self.config_dir / "devices" / "default.json", "w") as f:
+        with open(cls.config_dir / "devices" / "default.json", "w") as f:
             json.dump(default_config, f)
         
         # Create device-specific config
@@ -72,7 +73,7 @@ class TestConfigLoader(unittest.TestCase):
             }
         }
         
-        with open(self.config_dir / "devices" / "anbernic.json", "w") as f:
+        with open(cls.config_dir / "devices" / "anbernic.json", "w") as f:
             json.dump(device_config, f)
         
         # Create OS-specific config
@@ -83,11 +84,17 @@ class TestConfigLoader(unittest.TestCase):
             }
         }
         
-        with open(self.config_dir / "os_types" / "arkos.json", "w") as f:
+        with open(cls.config_dir / "os_types" / "arkos.json", "w") as f:
             json.dump(os_config, f)
 
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def setUp(self):
+        """Give each test its own directory for files it writes."""
+        self.test_dir = Path(self.temp_dir) / self._testMethodName
+        self.test_dir.mkdir()
 
     def test_load_default_config(self):
         """Test loading default configuration."""
@@ -149,7 +156,7 @@ class TestConfigLoader(unittest.TestCase):
         loader = ConfigLoader("desktop", "standard_linux", {}, self.app_paths)
         
         # Create invalid JSON file
-        invalid_file = Path(self.temp_dir) / "invalid.json"
+        invalid_file = self.test_dir / "invalid.json"
         with open(invalid_file, "w") as f:
             f.write("{ invalid json }")
         
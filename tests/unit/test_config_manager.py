@@ -20,8 +20,19 @@ from sbcman.services.config_manager import ConfigManager
 
 class TestConfigManager(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one temp root for the class; each test gets a subdirectory."""
+        cls._temp_root = Path(tempfile.mkdtemp())
+        cls.app_paths = AppPaths()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._temp_root, ignore_errors=True)
+
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = str(self._temp_root / self._testMethodName)
+        Path(self.temp_dir).mkdir()
         self.hw_config = {
             "paths": {
                 "data": self.temp_dir,
@@ -32,13 +43,8 @@ class TestConfigManager(unittest.TestCase):
             },
         }
 
-        self.app_paths = AppPaths()
         self.config = ConfigManager(self.hw_config, self.app_paths)
 
-    def tearDown(self):
-        
-        shutil.rmtree(self.temp_dir)
-
     def test_config_manager_initialization(self):
         self.assertIsNotNone(self.config.hw_config)
 
@@ -10,93 +10,69 @@ Tests for mounted filesystem detection and path management.
 import unittest
 from pathlib import Path
 import tempfile
-from unittest.mock import patch, mock_open
+from types import MappingProxyType
+from unittest.mock import Mock, patch, mock_open
 
 from sbcman.path.device import DevicePaths
 
 
-class TestDevicePaths(unittest.TestCase):
-
-    def setUp(self):
-        self.device_paths = DevicePaths()
+# /proc/mounts contents that yield no usable mount points
+EXCLUDED_MOUNTS = MappingProxyType({
+    "empty_file": "",
+    "sys_fs": "sysfs /sys sysfs rw 0 0\nproc /proc proc rw 0 0\n",
+    "tmpfs": "tmpfs /run tmpfs rw 0 0\ndevtmpfs /dev devtmpfs rw 0 0\n",
+    "cgroup": "cgroup /sys/fs/cgroup cgroup2 rw 0 0\n",
+    "special_fs": "debugfs /sys/kernel/debug debugfs rw 0 0\ntracefs /sys/kernel/tracing tracefs rw 0 0\n",
+    "system_prefixes": "/dev/sda1 /dev/sda1 ext4 rw 0 0\n",
+})
 
-    def test_get_mounted_filesystems_empty_file(self):
-        mock_data = ""
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            result = self.device_paths.get_mounted_filesystems()
-            self.assertEqual(result, [])
-
-    def test_get_mounted_filesystems_excludes_sys_fs(self):
-        mock_data = "sysfs /sys sysfs rw 0 0\nproc /proc proc rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            result = self.device_paths.get_mounted_filesystems()
-            self.assertEqual(result, [])
 
-    def test_get_mounted_filesystems_excludes_tmpfs(self):
-        mock_data = "tmpfs /run tmpfs rw 0 0\ndevtmpfs /dev devtmpfs rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            result = self.device_paths.get_mounted_filesystems()
-            self.assertEqual(result, [])
+class TestDevicePaths(unittest.TestCase):
 
-    def test_get_mounted_filesystems_excludes_cgroup(self):
-        mock_data = "cgroup /sys/fs/cgroup cgroup2 rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            result = self.device_paths.get_mounted_filesystems()
-            self.assertEqual(result, [])
+    @classmethod
+    def setUpClass(cls):
+        # DevicePaths holds no state, so one instance is shared
+        cls.device_paths = DevicePaths()
 
-    def test_get_mounted_filesystems_excludes_special_fs(self):
-        mock_data = "debugfs /sys/kernel/debug debugfs rw 0 0\ntracefs /sys/kernel/tracing tracefs rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            result = self.device_paths.get_mounted_filesystems()
-            self.assertEqual(result, [])
+    def _get_mounted_filesystems(self, mounts, exists=True, is_dir=True):
+        """Run get_mounted_filesystems against fake /proc/mounts content and path checks."""
+        with patch('builtins.open', mock_open(read_data=mounts)), \
+             patch.multiple(Path, exists=Mock(return_value=exists), is_dir=Mock(return_value=is_dir)):
+            return self.device_paths.get_mounted_filesystems()
 
-    def test_get_mounted_filesystems_excludes_system_prefixes(self):
-        mock_data = "/dev/sda1 /dev/sda1 ext4 rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            result = self.device_paths.get_mounted_filesystems()
-            self.assertEqual(result, [])
+    def test_get_mounted_filesystems_excludes(self):
+        for case, mock_data in EXCLUDED_MOUNTS.items():
+            with self.subTest(case=case):
+                result = self._get_mounted_filesystems(mock_data)
+                self.assertEqual(result, [])
 
     def test_get_mounted_filesystems_valid_mount(self):
         mock_data = "/dev/sda1 /mnt ext4 rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            with patch.object(Path, 'exists', return_value=True):
-                with patch.object(Path, 'is_dir', return_value=True):
-                    result = self.device_paths.get_mounted_filesystems()
-                    self.assertEqual(len(result), 1)
-                    self.assertEqual(str(result[0]), '/mnt')
+        result = self._get_mounted_filesystems(mock_data)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(str(result[0]), '/mnt')
 
     def test_get_mounted_filesystems_multiple_mounts(self):
         mock_data = "/dev/sda1 /mnt/data ext4 rw 0 0\n/dev/sda2 /mnt/backup xfs rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            with patch.object(Path, 'exists', return_value=True):
-                with patch.object(Path, 'is_dir', return_value=True):
-                    result = self.device_paths.get_mounted_filesystems()
-                    self.assertEqual(len(result), 2)
-                    self.assertEqual(str(result[0]), '/mnt/data')
-                    self.assertEqual(str(result[1]), '/mnt/backup')
+        result = self._get_mounted_filesystems(mock_data)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(str(result[0]), '/mnt/data')
+        self.assertEqual(str(result[1]), '/mnt/backup')
 
     def test_get_mounted_filesystems_filters_non_existent(self):
         mock_data = "/dev/sda1 /nonexistent ext4 rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            with patch.object(Path, 'exists', return_value=False):
-                result = self.device_paths.get_mounted_filesystems()
-            self.assertEqual(result, [])
+        result = self._get_mounted_filesystems(mock_data, exists=False)
+        self.assertEqual(result, [])
 
     def test_get_mounted_filesystems_filters_non_directory(self):
         mock_data = "/dev/sda1 /mnt/file ext4 rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            with patch.object(Path, 'exists', return_value=True):
-                with patch.object(Path, 'is_dir', return_value=False):
-                    result = self.device_paths.get_mounted_filesystems()
-            self.assertEqual(result, [])
+        result = self._get_mounted_filesystems(mock_data, is_dir=False)
+        self.assertEqual(result, [])
 
     def test_get_mounted_filesystems_malformed_line(self):
         mock_data = "malformed line\n/dev/sda1 /mnt ext4 rw 0 0\n"
-        with patch('builtins.open', mock_open(read_data=mock_data)):
-            with patch.object(Path, 'exists', return_value=True):
-                with patch.object(Path, 'is_dir', return_value=True):
-                    result = self.device_paths.get_mounted_filesystems()
-                    self.assertEqual(len(result), 1)
+        result = self._get_mounted_filesystems(mock_data)
+        self.assertEqual(len(result), 1)
 
     def test_get_mounted_filesystems_file_not_found(self):
         with patch('builtins.open', side_effect=FileNotFoundError()):
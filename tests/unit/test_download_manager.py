@@ -9,46 +9,75 @@ Tests for download management, installation, and observer pattern implementation
 
 from pathlib import Path
 from sbcman.path.paths import AppPaths
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
+import io
 import pathlib
+import shutil
+import tarfile
 import tempfile
 import unittest
 import zipfile
 
-from sbcman.services.download_manager import DownloadManager, DownloadObserver
+from sbcman.services.download_manager import DownloadManager
 from sbcman.proto import game_pb2
 from sbcman.services.network import NetworkService
+from tests.test_utils import RecordingDownloadObserver
 
 
-class TestDownloadObserver(DownloadObserver):
-    """Test implementation of DownloadObserver for testing purposes."""
-    
-    def __init__(self):
-        self.progress_calls = []
-        self.complete_calls = []
-        self.error_calls = []
-    
-    def on_progress(self, downloaded: int, total: int) -> None:
-        """Track progress calls."""
-        self.progress_calls.append((downloaded, total))
-    
-    def on_complete(self, success: bool, message: str) -> None:
-        """Track complete calls."""
-        self.complete_calls.append((success, message))
-    
-    def on_error(self, error_message: str) -> None:
-        """Track error calls."""
-        self.error_calls.append(error_message)
+def _zip_bytes(name, content):
+    """Build a single-file zip archive in memory."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+def _tar_bytes(name, content):
+    """Build a single-file tar archive in memory."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tf:
+        info = tarfile.TarInfo(name=name)
+        info.size = len(content)
+        tf.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def _game(**fields):
+    """Build a Game message with the given fields set."""
+    game = game_pb2.Game()
+    for name, value in fields.items():
+        setattr(game, name, value)
+    return game
+
+
+# Games shared by the tests that only read them
+ZIP_GAME = _game(id="test-game", name="Test Game",
+                 download_url="https://example.com/test-game.zip")
+TAR_GAME = _game(id="test-game", name="Test Game", entry_point="main.py")
 
 
 class TestDownloadManager(unittest.TestCase):
     """Test cases for DownloadManager."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temp root for the class; each test gets a subdirectory."""
+        cls._temp_root = pathlib.Path(tempfile.mkdtemp())
+
+        # Patch the network service once for the class; setUp resets the mocks
+        cls.network = cls.enterClassContext(
+            patch.multiple(NetworkService, download_file=DEFAULT, get_file_size=DEFAULT))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the class temp root."""
+        shutil.rmtree(cls._temp_root, ignore_errors=True)
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.temp_dir = self._temp_root / self._testMethodName
         self.games_dir = self.temp_dir / "games"
-        self.games_dir.mkdir(exist_ok=True)
+        self.games_dir.mkdir(parents=True)
         
         self.hw_config = {
             "paths": {
@@ -58,16 +87,14 @@ class TestDownloadManager(unittest.TestCase):
 
         app_paths = AppPaths(self.temp_dir, self.temp_dir)
         self.download_manager = DownloadManager(self.hw_config, app_paths, None, None)
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+
+        for mock in self.network.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+        self.mock_download_file = self.network['download_file']
+        self.mock_get_file_size = self.network['get_file_size']
+
+        # Avoid HEAD requests for the disk space check
+        self.mock_get_file_size.return_value = None
     
     def test_download_manager_initialization(self):
         """Test download manager initialization."""
@@ -96,23 +123,19 @@ class TestDownloadManager(unittest.TestCase):
         app_paths = AppPaths(self.temp_dir, self.temp_dir)
         self.download_manager = DownloadManager(self.hw_config, app_paths, None, None)
         
-        # Create a test game
+        # A successful install marks the game installed, so work on a copy
         game = game_pb2.Game()
-        game.id = "test-game"
-        game.name = "Test Game"
-        game.download_url="https://example.com/test-game.zip"
+        game.CopyFrom(ZIP_GAME)
         
         # Create an observer
-        observer = TestDownloadObserver()
+        observer = RecordingDownloadObserver()
         
         # Download the game
         self.download_manager.download_game(game, observer)
         
-        # Wait for the download to complete by checking the flag
-        import time
-        start_time = time.time()
-        while self.download_manager.is_downloading and time.time() - start_time < 5:
-            time.sleep(0.1)
+        # Wait for the download thread to finish
+        self.download_manager.current_download.join(timeout=5)
+        self.assertFalse(self.download_manager.current_download.is_alive())
         
         # Verify the network service was called correctly
         mock_network_service.download_file.assert_called_once()
@@ -122,162 +145,157 @@ class TestDownloadManager(unittest.TestCase):
         self.assertTrue(observer.complete_calls[0][0])  # success should be True
         self.assertIn("Successfully installed Test Game", observer.complete_calls[0][1])
     
-    @patch.object(NetworkService, 'download_file')
-    def test_download_game_failure(self, mock_download_file):
+    def test_download_game_failure(self):
         """Test failed game download."""
         # Configure the mock
-        mock_download_file.return_value = False
+        self.mock_download_file.return_value = False
         
-        # Create a test game
-        game = game_pb2.Game()
-        game.id = "test-game"
-        game.name = "Test Game"
-        game.download_url="https://example.com/test-game.zip"
+        game = ZIP_GAME
         
         # Create an observer
-        observer = TestDownloadObserver()
+        observer = RecordingDownloadObserver()
         
         # Download the game
         self.download_manager.download_game(game, observer)
         
-        # Wait for the download to complete by checking the flag
-        import time
-        start_time = time.time()
-        while self.download_manager.is_downloading and time.time() - start_time < 5:
-            time.sleep(0.1)
+        # Wait for the download thread to finish
+        self.download_manager.current_download.join(timeout=5)
+        self.assertFalse(self.download_manager.current_download.is_alive())
         
         # Verify the network service was called correctly
-        mock_download_file.assert_called_once()
+        self.mock_download_file.assert_called_once()
         
         # Verify the observer was notified of error
         self.assertEqual(len(observer.error_calls), 1)
         self.assertIn("Download failed", observer.error_calls[0])
     
-    @patch.object(NetworkService, 'download_file')
-    def test_download_game_error(self, mock_download_file):
+    def test_download_game_error(self):
         """Test game download with exception."""
         # Configure the mock
-        mock_download_file.side_effect = Exception("Network error")
+        self.mock_download_file.side_effect = Exception("Network error")
         
-        # Create a test game
-        game = game_pb2.Game()
-        game.id = "test-game"
-        game.name = "Test Game"
-        game.download_url="https://example.com/test-game.zip"        
+        game = ZIP_GAME
         
         # Create an observer
-        observer = TestDownloadObserver()
+        observer = RecordingDownloadObserver()
         
         # Download the game
         self.download_manager.download_game(game, observer)
         
-        # Wait for the download to complete by checking the flag
-        import time
-        start_time = time.time()
-        while self.download_manager.is_downloading and time.time() - start_time < 5:
-            time.sleep(0.1)
+        # Wait for the download thread to finish
+        self.download_manager.current_download.join(timeout=5)
+        self.assertFalse(self.download_manager.current_download.is_alive())
         
         # Verify the network service was called correctly
-        mock_download_file.assert_called_once()
+        self.mock_download_file.assert_called_once()
         
         # Verify the observer was notified of error
         self.assertEqual(len(observer.error_calls), 1)
         self.assertIn("Network error", observer.error_calls[0])
     
+    def test_download_game_without_observer(self):
+        """Test that a download without an observer still runs to completion."""
+        self.mock_download_file.return_value = False
+
+        game = ZIP_GAME
+
+        self.download_manager.download_game(game)
+        self.download_manager.current_download.join(timeout=5)
+
+        self.mock_download_file.assert_called_once()
+        self.assertFalse(self.download_manager.is_downloading)
+
+    @patch('sbcman.services.download_manager.shutil.disk_usage')
+    def test_download_game_insufficient_disk_space(self, mock_disk_usage):
+        """Test that a download is refused when the disk is too full."""
+        self.mock_get_file_size.return_value = 1000
+        mock_disk_usage.return_value = Mock(free=1500)
+
+        game = ZIP_GAME
+
+        observer = RecordingDownloadObserver()
+        self.download_manager.download_game(game, observer)
+
+        # The check runs on the download thread, before any data is fetched
+        self.download_manager.current_download.join(timeout=5)
+        self.assertFalse(self.download_manager.current_download.is_alive())
+        self.assertFalse(self.download_manager.is_downloading)
+        self.mock_download_file.assert_not_called()
+
+        self.assertEqual(len(observer.error_calls), 1)
+        self.assertIn("Insufficient disk space", observer.error_calls[0])
+        self.assertEqual(len(observer.complete_calls), 1)
+        self.assertFalse(observer.complete_calls[0][0])
+
+    @patch('sbcman.services.download_manager.shutil.disk_usage')
+    def test_check_disk_space_sufficient(self, mock_disk_usage):
+        """Test the disk space check passes with enough headroom."""
+        self.mock_get_file_size.return_value = 1000
+        mock_disk_usage.return_value = Mock(free=2000)
+
+        game = ZIP_GAME
+
+        self.assertIsNone(self.download_manager._check_disk_space(game))
+
     def test_extract_game_zip(self):
         """Test extracting a ZIP game archive."""
         from sbcman.services.install_game import GameInstaller
         
-        # Create a test game
-        game = game_pb2.Game()
-        game.id = "test-game"
-        game.name = "Test Game"
-        game.download_url="https://example.com/test-game.zip"
-        
-        # Create a temporary ZIP file with some content
-        with tempfile.TemporaryDirectory() as temp_dir:
-            zip_path = Path(temp_dir) / "test-game.zip"
-            extract_dir = Path(temp_dir) / "extracted"
-            
-            # Create a ZIP file with a simple file inside
-            with zipfile.ZipFile(zip_path, 'w') as zip_file:
-                zip_file.writestr("main.py", "print('Hello, World!')")
-            
-            # Extract the game using GameInstaller
-            app_paths = AppPaths(self.temp_dir, self.temp_dir)
-            installer = GameInstaller(None, app_paths)
-            install_dir = installer._extract_archive(zip_path, game)
-            
-            # Verify the installation directory was created
-            self.assertTrue(install_dir.exists())
-            
-            # Verify the entry point file was extracted and has executable permissions
-            entry_point = install_dir / "main.py"
-            self.assertTrue(entry_point.exists())
-            
-            # Check if permissions are set correctly (might not work on all systems)
-            # Just verify the file exists for now
+        game = ZIP_GAME
+        
+        # Build the ZIP archive in memory and write it in one go
+        zip_path = self.temp_dir / "test-game.zip"
+        zip_path.write_bytes(_zip_bytes("main.py", "print('Hello, World!')"))
+        
+        # Extract the game using GameInstaller
+        app_paths = AppPaths(self.temp_dir, self.temp_dir)
+        installer = GameInstaller(None, app_paths)
+        install_dir = installer._extract_archive(zip_path, game)
+        
+        # Verify the installation directory was created
+        self.assertTrue(install_dir.exists())
+        
+        # Verify the entry point file was extracted
+        entry_point = install_dir / "main.py"
+        self.assertTrue(entry_point.exists())
     
     def test_extract_game_tar(self):
         """Test extracting a TAR game archive."""
-        try:
-            import tarfile
-            from sbcman.services.install_game import GameInstaller
-            
-            # Create a test game
-            game = game_pb2.Game()
-            game.id = "test-game"
-            game.name = "Test Game"
-            game.entry_point="main.py"
-            
-            # Create a temporary TAR file with some content
-            with tempfile.TemporaryDirectory() as temp_dir:
-                tar_path = Path(temp_dir) / "test-game.tar"
-                extract_dir = Path(temp_dir) / "extracted"
-                
-                # Create a TAR file with a simple file inside
-                with tarfile.open(tar_path, 'w') as tar_file:
-                    # Create a temporary file to add to the archive
-                    temp_file = Path(temp_dir) / "main.py"
-                    temp_file.write_text("print('Hello, World!')")
-                    tar_file.add(temp_file, "main.py")
-                
-                # Extract the game using GameInstaller
-                app_paths = AppPaths(self.temp_dir, self.temp_dir)
-                installer = GameInstaller(None, app_paths)
-                install_dir = installer._extract_archive(tar_path, game)
-                
-                # Verify the installation directory was created
-                self.assertTrue(install_dir.exists())
-                
-                # Verify the entry point file was extracted
-                entry_point = install_dir / "main.py"
-                self.assertTrue(entry_point.exists())
-        except ImportError:
-            # tarfile not available, skip this test
-            pass
+        from sbcman.services.install_game import GameInstaller
+        
+        game = TAR_GAME
+        
+        # Build the TAR archive in memory and write it in one go
+        tar_path = self.temp_dir / "test-game.tar"
+        tar_path.write_bytes(_tar_bytes("main.py", b"print('Hello, World!')"))
+        
+        # Extract the game using GameInstaller
+        app_paths = AppPaths(self.temp_dir, self.temp_dir)
+        installer = GameInstaller(None, app_paths)
+        install_dir = installer._extract_archive(tar_path, game)
+        
+        # Verify the installation directory was created
+        self.assertTrue(install_dir.exists())
+        
+        # Verify the entry point file was extracted
+        entry_point = install_dir / "main.py"
+        self.assertTrue(entry_point.exists())
     
     def test_extract_game_unsupported_format(self):
         """Test extracting a game with unsupported archive format."""
         from sbcman.services.install_game import GameInstaller
         
-        # Create a test game
-        game = game_pb2.Game()
-        game.id = "test-game"
-        game.name = "Test Game"        
-        
-        # Create a temporary file with unsupported extension
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file_path = Path(temp_dir) / "test-game.unsupported"
-            file_path.write_text("test content")
-            
-            # Try to extract the game using GameInstaller - should raise an exception
-            app_paths = AppPaths(self.temp_dir, self.temp_dir)
-            installer = GameInstaller(None, app_paths)
-            with self.assertRaises(Exception) as context:
-                installer._extract_archive(file_path, game)
-            
-            self.assertIn("Unsupported archive format", str(context.exception))
+        game = ZIP_GAME
+        
+        # Create a file with unsupported extension
+        file_path = self.temp_dir / "test-game.unsupported"
+        file_path.write_text("test content")
+        
+        # Try to extract the game using GameInstaller - should raise an exception
+        app_paths = AppPaths(self.temp_dir, self.temp_dir)
+        installer = GameInstaller(None, app_paths)
+        with self.assertRaisesRegex(ValueError, "Unsupported archive format"):
+            installer._extract_archive(file_path, game)
     
     def test_cancel_download(self):
         """Test canceling a download."""
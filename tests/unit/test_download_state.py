@@ -10,7 +10,8 @@ Tests for download state functionality, UI rendering, and event handling.
 import unittest
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import Mock
 
 import pygame
 
@@ -18,28 +19,54 @@ from sbcman.states.download_state import DownloadState
 from sbcman.proto import game_pb2
 
 
+def _game(game_id, name):
+    """Build a Game message with an id and a name."""
+    game = game_pb2.Game()
+    game.id = game_id
+    game.name = name
+    return game
+
+
+# Games shared by the tests; the state only reads them
+GAMES = tuple(_game(f"game{i}", f"Game {i}") for i in range(1, 4))
+
+
 class TestDownloadState(unittest.TestCase):
     """Test cases for DownloadState."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Initialize pygame for testing
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame and create the data and games directories once for the class."""
         pygame.init()
-        
-        # Create a mock state manager
-        self.mock_state_manager = Mock()
-        
-        # Create a mock hardware config
-        self.hw_config = {
+
+        cls._temp = tempfile.TemporaryDirectory()
+        cls.data_dir = Path(cls._temp.name) / "data"
+        cls.games_dir = Path(cls._temp.name) / "games"
+        cls.data_dir.mkdir()
+        cls.games_dir.mkdir()
+
+        # The state only reads the hardware config
+        cls.hw_config = {
             "paths": {
-                "data": tempfile.mkdtemp(),
-                "games": tempfile.mkdtemp(),
+                "data": str(cls.data_dir),
+                "games": str(cls.games_dir),
             },
-            "display": {
-                "resolution": [1280, 720],
+            "display": MappingProxyType({
+                "resolution": (1280, 720),
                 "fps_target": 60,
-            }
+            }),
         }
+
+    @classmethod
+    def tearDownClass(cls):
+        """Shut down pygame and remove the class temp directory."""
+        pygame.quit()
+        cls._temp.cleanup()
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Create a mock state manager
+        self.mock_state_manager = Mock()
         
         # Create a mock game library
         self.mock_game_library = Mock()
@@ -55,15 +82,6 @@ class TestDownloadState(unittest.TestCase):
         self.download_state.game_library = self.mock_game_library
         self.download_state.input_handler = self.mock_input_handler
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        pygame.quit()
-        
-        # Clean up temporary directories
-        import shutil
-        shutil.rmtree(self.hw_config["paths"]["data"])
-        shutil.rmtree(self.hw_config["paths"]["games"])
-    
     def test_download_state_initialization(self):
         """Test download state initialization."""
         # Call on_enter to initialize the state
@@ -78,16 +96,7 @@ class TestDownloadState(unittest.TestCase):
     
     def test_on_enter_with_available_games(self):
         """Test entering download state with available games."""
-        # Create test games
-        game1 = game_pb2.Game()
-        game1.id = "game1"
-        game1.name = "Game 1"
-
-        game2 = game_pb2.Game()
-        game2.id = "game2"
-        game2.name = "Game 2"
-
-        test_games = [game1, game2]
+        test_games = GAMES[:2]
         
         # Configure mock game library to return test games
         self.mock_game_library.get_available_games.return_value = test_games
@@ -167,27 +176,15 @@ class TestDownloadState(unittest.TestCase):
     
     def test_handle_events_cancel_action(self):
         """Test handling cancel action events."""
-        game1 = game_pb2.Game()
-        game1.id = "game1"
-        game1.name = "Game 1"
-
-        game2 = game_pb2.Game()
-        game2.id = "game2"
-        game2.name = "Game 2"
-
-        test_games = [game1, game2]
-        
         # Enter the state first to initialize it
-        self.mock_game_library.get_available_games.return_value = [
-            game1, game2
-        ]
+        self.mock_game_library.get_available_games.return_value = GAMES[:2]
         self.download_state.on_enter(None)
         
         # Set up mock input handler to return True for cancel action
         self.mock_input_handler.is_action_pressed.return_value = True
         
-        # Create a mock event list
-        mock_events = [Mock()]
+        # Create an event list
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
         
         # Handle events
         self.download_state.handle_events(mock_events)
@@ -200,57 +197,30 @@ class TestDownloadState(unittest.TestCase):
     
     def test_handle_events_back_input(self):
         """Test handling back/exit input events."""
-        game1 = game_pb2.Game()
-        game1.id = "game1"
-        game1.name = "Game 1"
-
-        game2 = game_pb2.Game()
-        game2.id = "game2"
-        game2.name = "Game 2"
-
-        
         # Enter the state first to initialize it
-        self.mock_game_library.get_available_games.return_value = [
-            game1, game2
-        ]
+        self.mock_game_library.get_available_games.return_value = GAMES[:2]
         self.download_state.on_enter(None)
         
         # Set up mock input handler to return False for cancel action
         self.mock_input_handler.is_action_pressed.return_value = False
         
-        # Create a mock event that simulates ESC key press
-        mock_event = Mock()
-        mock_event.type = pygame.KEYDOWN
-        mock_event.key = pygame.K_ESCAPE
+        # Create an event that simulates ESC key press
+        mock_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
         mock_events = [mock_event]
         
+        # The state is rebuilt for every test, so its methods can be stubbed directly
+        self.download_state._handle_exit_input = Mock(return_value=True)
+        
         # Handle events
-        with patch.object(self.download_state, '_handle_exit_input', return_value=True):
-            self.download_state.handle_events(mock_events)
-            
-            # Verify state transition was requested
-            self.mock_state_manager.change_state.assert_called_once_with("menu")
+        self.download_state.handle_events(mock_events)
+        
+        # Verify state transition was requested
+        self.mock_state_manager.change_state.assert_called_once_with("menu")
     
     def test_handle_events_navigation(self):
         """Test handling navigation events."""
-
-        game1 = game_pb2.Game()
-        game1.id = "game1"
-        game1.name = "Game 1"
-
-        game2 = game_pb2.Game()
-        game2.id = "game2"
-        game2.name = "Game 2"
-
-        game3 = game_pb2.Game()
-        game3.id = "game3"
-        game3.name = "Game 3"        
-        
-        # Create test games
-        test_games = [game1, game2, game3]
-        
         # Enter the state first to initialize it
-        self.mock_game_library.get_available_games.return_value = test_games
+        self.mock_game_library.get_available_games.return_value = GAMES
         self.download_state.on_enter(None)
         
         # Set up mock input handler to return False for cancel action
@@ -264,8 +234,8 @@ class TestDownloadState(unittest.TestCase):
             False,  # confirm
         ]
         
-        # Create a mock event list
-        mock_events = [Mock()]
+        # Create an event list
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
         
         # Handle events
         self.download_state.handle_events(mock_events)
@@ -290,16 +260,8 @@ class TestDownloadState(unittest.TestCase):
     
     def test_handle_events_confirm_download(self):
         """Test handling confirm action to start download."""
-
-        game1 = game_pb2.Game()
-        game1.id = "game1"
-        game1.name = "Game 1"
-        
-        # Create test games
-        test_games = [game1]        
-        
         # Enter the state first to initialize it
-        self.mock_game_library.get_available_games.return_value = test_games
+        self.mock_game_library.get_available_games.return_value = GAMES[:1]
         self.download_state.on_enter(None)
         
         # Set up mock input handler
@@ -310,18 +272,20 @@ class TestDownloadState(unittest.TestCase):
             True,   # confirm
         ]
         
-        # Create a mock event list
-        mock_events = [Mock()]
+        # Create an event list
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
+        
+        # on_enter creates a fresh download manager, so stub it directly
+        mock_download = self.download_state.download_manager.download_game = Mock()
         
         # Handle events
-        with patch.object(self.download_state.download_manager, 'download_game') as mock_download:
-            self.download_state.handle_events(mock_events)
-            
-            # Verify download was started
-            #mock_download.assert_called_once()
-            
-            # Verify downloading flag was set
-            #self.assertTrue(self.download_state.downloading)
+        self.download_state.handle_events(mock_events)
+        
+        # Verify download was started
+        #mock_download.assert_called_once()
+        
+        # Verify downloading flag was set
+        #self.assertTrue(self.download_state.downloading)
     
     def test_handle_events_confirm_no_games(self):
         """Test handling confirm action when no games are available."""
@@ -337,18 +301,20 @@ class TestDownloadState(unittest.TestCase):
             True,   # confirm
         ]
         
-        # Create a mock event list
-        mock_events = [Mock()]
+        # Create an event list
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
+        
+        # on_enter creates a fresh download manager, so stub it directly
+        mock_download = self.download_state.download_manager.download_game = Mock()
         
         # Handle events
-        with patch.object(self.download_state.download_manager, 'download_game') as mock_download:
-            self.download_state.handle_events(mock_events)
-            
-            # Verify download was not started
-            mock_download.assert_not_called()
-            
-            # Verify downloading flag was not set
-            self.assertFalse(self.download_state.downloading)
+        self.download_state.handle_events(mock_events)
+        
+        # Verify download was not started
+        mock_download.assert_not_called()
+        
+        # Verify downloading flag was not set
+        self.assertFalse(self.download_state.downloading)
     
     def test_render_when_downloading(self):
         """Test rendering download state when downloading."""
@@ -369,20 +335,8 @@ class TestDownloadState(unittest.TestCase):
         
     def test_render_when_not_downloading_with_games(self):
         """Test rendering download state when not downloading but games are available."""
-
-        game1 = game_pb2.Game()
-        game1.id = "game1"
-        game1.name = "Game 1"
-
-        game2 = game_pb2.Game()
-        game2.id = "game2"
-        game2.name = "Game 2"
-        
-        # Create test games
-        test_games = [game1, game2]
-        
         # Enter the state first to initialize it
-        self.mock_game_library.get_available_games.return_value = test_games
+        self.mock_game_library.get_available_games.return_value = GAMES[:2]
         self.download_state.on_enter(None)
         
         # Set up non-downloading state
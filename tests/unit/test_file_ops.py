@@ -7,6 +7,8 @@ Unit Tests for File Operations Service
 Tests for file operations including copying, moving, and directory management.
 """
 
+import errno
+import os
 import unittest
 import tempfile
 import shutil
@@ -40,6 +42,166 @@ class TestFileOps(unittest.TestCase):
         self.assertTrue(new_dir.exists())
         self.assertTrue(new_dir.is_dir())
 
+    def test_copy_file(self):
+        """Test copying a file preserves content and modification time."""
+        source_file = self.temp_dir / "source.bin"
+        source_file.write_bytes(os.urandom(300000))
+        os.utime(source_file, (1000000000, 1000000000))
+        dest_file = self.temp_dir / "sub" / "dest.bin"
+        
+        result = self.file_ops.copy_file(source_file, dest_file)
+        
+        self.assertTrue(result)
+        self.assertEqual(dest_file.read_bytes(), source_file.read_bytes())
+        self.assertEqual(dest_file.stat().st_mtime, 1000000000)
+
+    @patch('sbcman.services.file_ops.os.copy_file_range', side_effect=OSError(errno.EXDEV, "Cross-device link"),
+           create=True)
+    def test_copy_file_copy_file_range_unsupported(self, mock_copy_file_range):
+        """Test copying falls back to sendfile when copy_file_range is unsupported."""
+        source_file = self.temp_dir / "source.txt"
+        source_file.write_text("Copy me")
+        dest_file = self.temp_dir / "dest.txt"
+        
+        with patch('sbcman.services.file_ops.os.sendfile', wraps=os.sendfile) as mock_sendfile:
+            result = self.file_ops.copy_file(source_file, dest_file)
+        
+        self.assertTrue(result)
+        mock_copy_file_range.assert_called_once()
+        mock_sendfile.assert_called()
+        self.assertEqual(dest_file.read_text(), "Copy me")
+
+    @patch('sbcman.services.file_ops.os.copy_file_range', side_effect=OSError(errno.ENOSYS, "Not implemented"),
+           create=True)
+    @patch('sbcman.services.file_ops.os.sendfile', side_effect=OSError(errno.EINVAL, "Invalid argument"))
+    def test_copy_file_sendfile_unsupported(self, mock_sendfile, mock_copy_file_range):
+        """Test copying falls back to a buffered copy when sendfile is unsupported."""
+        source_file = self.temp_dir / "source.txt"
+        source_file.write_text("Copy me")
+        dest_file = self.temp_dir / "dest.txt"
+        
+        result = self.file_ops.copy_file(source_file, dest_file)
+        
+        self.assertTrue(result)
+        mock_sendfile.assert_called_once()
+        self.assertEqual(dest_file.read_text(), "Copy me")
+
+    @patch('sbcman.services.file_ops.os.copy_file_range', return_value=0, create=True)
+    def test_copy_file_copy_file_range_copies_nothing(self, mock_copy_file_range):
+        """Test copying falls back when copy_file_range returns 0 for a non-empty file."""
+        source_file = self.temp_dir / "source.txt"
+        source_file.write_text("Copy me")
+        dest_file = self.temp_dir / "dest.txt"
+        
+        result = self.file_ops.copy_file(source_file, dest_file)
+        
+        self.assertTrue(result)
+        mock_copy_file_range.assert_called_once()
+        self.assertEqual(dest_file.read_text(), "Copy me")
+
+    @patch('sbcman.services.file_ops.os.copy_file_range', side_effect=OSError(errno.ENOSYS, "Not implemented"),
+           create=True)
+    @patch('sbcman.services.file_ops.os.sendfile', return_value=0)
+    def test_copy_file_sendfile_sends_nothing(self, mock_sendfile, mock_copy_file_range):
+        """Test copying falls back to a buffered copy when sendfile returns 0 for a non-empty file."""
+        source_file = self.temp_dir / "source.txt"
+        source_file.write_text("Copy me")
+        dest_file = self.temp_dir / "dest.txt"
+        
+        result = self.file_ops.copy_file(source_file, dest_file)
+        
+        self.assertTrue(result)
+        mock_sendfile.assert_called_once()
+        self.assertEqual(dest_file.read_text(), "Copy me")
+
+    @patch('sbcman.services.file_ops.COPY_BUFSIZE', 4096)
+    @patch('sbcman.services.file_ops.os.copy_file_range', side_effect=OSError(errno.ENOSYS, "Not implemented"),
+           create=True)
+    @patch('sbcman.services.file_ops.os.sendfile', side_effect=OSError(errno.ENOSYS, "Not implemented"))
+    def test_copy_file_buffered_multiple_chunks(self, mock_sendfile, mock_copy_file_range):
+        """Test the buffered copy handles files larger than the buffer."""
+        data = os.urandom(4096 * 3 + 17)
+        source_file = self.temp_dir / "source.bin"
+        source_file.write_bytes(data)
+        dest_file = self.temp_dir / "dest.bin"
+        
+        result = self.file_ops.copy_file(source_file, dest_file)
+        
+        self.assertTrue(result)
+        self.assertEqual(dest_file.read_bytes(), data)
+
+    def test_copy_file_to_directory(self):
+        """Test copying into a directory keeps the source file name."""
+        source_file = self.temp_dir / "source.txt"
+        source_file.write_text("Copy me")
+        dest_dir = self.temp_dir / "dest"
+        dest_dir.mkdir()
+        
+        result = self.file_ops.copy_file(source_file, dest_dir)
+        
+        self.assertTrue(result)
+        self.assertEqual((dest_dir / "source.txt").read_text(), "Copy me")
+
+    def test_copy_file_same_file(self):
+        """Test copying a file onto itself fails without truncating it."""
+        source_file = self.temp_dir / "source.txt"
+        source_file.write_text("Copy me")
+        
+        for dest in (source_file, self.temp_dir):
+            with self.subTest(dest=dest.name):
+                result = self.file_ops.copy_file(source_file, dest)
+                
+                self.assertFalse(result)
+                self.assertEqual(source_file.read_text(), "Copy me")
+
+    def test_copy_many(self):
+        """Test copying several files into shared destination directories."""
+        (self.temp_dir / "dest").mkdir()
+        pairs = []
+        for i in range(4):
+            source_file = self.temp_dir / f"source{i}.txt"
+            source_file.write_text(f"File {i}")
+            pairs.append((source_file, self.temp_dir / "dest" / f"dir{i % 2}" / source_file.name))
+        
+        with patch.object(Path, 'mkdir', autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            result = self.file_ops.copy_many(pairs)
+        
+        self.assertTrue(result)
+        self.assertEqual(mock_mkdir.call_count, 2)
+        for source_file, dest_file in pairs:
+            self.assertEqual(dest_file.read_text(), source_file.read_text())
+
+    def test_copy_many_partial_failure(self):
+        """Test copy_many reports failure but still copies the remaining files."""
+        source_file = self.temp_dir / "source.txt"
+        source_file.write_text("Copy me")
+        pairs = [
+            (self.temp_dir / "nonexistent.txt", self.temp_dir / "dest" / "missing.txt"),
+            (source_file, self.temp_dir / "dest" / "source.txt"),
+        ]
+        
+        result = self.file_ops.copy_many(pairs)
+        
+        self.assertFalse(result)
+        self.assertEqual((self.temp_dir / "dest" / "source.txt").read_text(), "Copy me")
+
+    def test_copy_many_same_file_and_directory(self):
+        """Test copy_many skips same-file copies and copies into directories."""
+        source_file = self.temp_dir / "source.txt"
+        source_file.write_text("Copy me")
+        dest_dir = self.temp_dir / "dest"
+        dest_dir.mkdir()
+        pairs = [
+            (source_file, source_file),
+            (source_file, dest_dir),
+        ]
+        
+        result = self.file_ops.copy_many(pairs)
+        
+        self.assertFalse(result)
+        self.assertEqual(source_file.read_text(), "Copy me")
+        self.assertEqual((dest_dir / "source.txt").read_text(), "Copy me")
+
     def test_copy_file_source_not_exists(self):
         """Test copying a file that doesn't exist."""
         source_file = self.temp_dir / "nonexistent.txt"
@@ -91,6 +253,24 @@ class TestFileOps(unittest.TestCase):
         result = self.file_ops.delete_file(non_existent)
         self.assertFalse(result)
 
+    def test_delete_directory_recursive(self):
+        """Test deleting a directory with content."""
+        test_dir = self.temp_dir / "to_delete"
+        test_dir.mkdir()
+        (test_dir / "file.txt").write_text("Content")
+        
+        result = self.file_ops.delete_directory(test_dir, recursive=True)
+        
+        self.assertTrue(result)
+        self.assertFalse(test_dir.exists())
+
+    def test_delete_directory_not_exists(self):
+        """Test deleting a directory that doesn't exist."""
+        non_existent = self.temp_dir / "nonexistent"
+        
+        self.assertFalse(self.file_ops.delete_directory(non_existent))
+        self.assertFalse(self.file_ops.delete_directory(non_existent, recursive=True))
+
     # TODO: Fix
     def disabled_test_delete_directory(self):
         """Test deleting a directory."""
@@ -30,7 +30,8 @@ class TestGameLibrary(unittest.TestCase):
             }
         }
 
-        self.library = GameLibrary(self.hw_config, AppPaths())
+        self.app_paths = AppPaths(Path(self.temp_dir), Path(self.temp_dir))
+        self.library = GameLibrary(Mock(), self.hw_config, self.app_paths)
 
     def tearDown(self):
         shutil.rmtree(self.temp_dir)
@@ -84,9 +85,36 @@ class TestGameLibrary(unittest.TestCase):
         self.library.add_game(game)
         self.library.save_games()
         
-        library2 = GameLibrary(self.hw_config, AppPaths())
+        library2 = GameLibrary(Mock(), self.hw_config, self.app_paths)
         library2.games = library2.load_games(library2.games_file)
         
         self.assertEqual(len(library2.games), 1)
         self.assertEqual(library2.games[0].id, "test-game")
         self.assertTrue(library2.games[0].installed)
+
+    def test_save_games_writes_once_per_change(self):
+        self.library.add_game(create_game(game_id="game1", name="Game 1"))
+        self.library.add_game(create_game(game_id="game2", name="Game 2"))
+        
+        with patch.object(self.library, '_save_games_to_file', return_value=True) as mock_save:
+            self.library.save_games()
+            self.library.save_games()
+            
+            self.assertEqual(mock_save.call_count, 1)
+            
+            self.library.update_game(create_game(game_id="game1", name="Game 1b"))
+            self.library.save_games()
+            
+            self.assertEqual(mock_save.call_count, 2)
+
+    def test_load_games_missing_file(self):
+        games = self.library.load_games(Path(self.temp_dir) / "missing.json")
+
+        self.assertEqual(games, [])
+
+    def test_load_games_invalid_json(self):
+        games_file = Path(self.temp_dir) / "games.json"
+        games_file.write_text("{not json")
+        games = self.library.load_games(games_file)
+
+        self.assertEqual(games, [])
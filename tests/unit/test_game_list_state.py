@@ -20,8 +20,15 @@ from sbcman.proto import game_pb2
 
 class TestGameListState(unittest.TestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
         self.mock_state_manager = Mock()
         self.game_list_state = GameListState(self.mock_state_manager)
         self.hw_config = {
@@ -35,9 +42,6 @@ class TestGameListState(unittest.TestCase):
         self.mock_game_library = Mock()
         self.game_list_state.game_library = self.mock_game_library
     
-    def tearDown(self):
-        pygame.quit()
-    
     def test_game_list_state_initialization(self):
         # Create test games
         game1 = game_pb2.Game()
@@ -108,15 +112,9 @@ class TestGameListState(unittest.TestCase):
         self.game_list_state.selected_index = 0
         self.game_list_state.scroll_offset = 0
         
-        self.mock_input_handler.is_action_pressed.side_effect = [
-            False,
-            False,
-            True,
-            False,
-            False,
-        ]
+        self.mock_input_handler.actions_pressed.return_value = {"down"}
         
-        mock_events = [Mock()]
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
         
         with patch.object(self.game_list_state, '_handle_exit_input', return_value=False):
             self.game_list_state.handle_events(mock_events)
@@ -134,15 +132,9 @@ class TestGameListState(unittest.TestCase):
         self.game_list_state.games = test_games
         self.game_list_state.selected_index = 0
         
-        self.mock_input_handler.is_action_pressed.side_effect = [
-            False,
-            False,
-            False,
-            True,
-            False,
-        ]
+        self.mock_input_handler.actions_pressed.return_value = {"confirm"}
         
-        mock_events = [Mock()]
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
         
         with patch.object(self.game_list_state, '_handle_exit_input', return_value=False):
             self.game_list_state.handle_events(mock_events)
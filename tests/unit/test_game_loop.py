@@ -12,7 +12,7 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import pygame
 
-from sbcman.core.game_loop import GameLoop
+from sbcman.core.game_loop import BACKGROUND_FPS, GameLoop
 
 
 class TestGameLoop(unittest.TestCase):
@@ -176,6 +176,51 @@ class TestGameLoop(unittest.TestCase):
         # Verify clock was ticked with correct FPS
         mock_clock.tick.assert_called_with(30)
 
+    @patch('pygame.event.get')
+    @patch('pygame.display.flip')
+    @patch('pygame.time.Clock')
+    def test_non_input_events_filtered(self, mock_clock_class, mock_display_flip, mock_event_get):
+        """Test that only input events are routed to the state manager."""
+        mock_clock = Mock()
+        mock_clock.tick.return_value = 16
+
+        mock_state_manager = Mock()
+        mock_state_manager.handle_events.side_effect = lambda events: setattr(self.game_loop, 'running', False)
+
+        key_event = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_UP})
+        motion_event = pygame.event.Event(pygame.MOUSEMOTION, {'pos': (1, 1)})
+        axis_event = pygame.event.Event(pygame.JOYAXISMOTION, {'axis': 0, 'value': 0.1})
+        mock_event_get.return_value = [motion_event, key_event, axis_event]
+
+        self.game_loop.run(mock_state_manager, mock_clock, target_fps=60)
+
+        mock_state_manager.handle_events.assert_called_once_with([key_event])
+
+    @patch('pygame.event.get')
+    @patch('pygame.display.flip')
+    def test_render_skipped_while_display_released(self, mock_display_flip, mock_event_get):
+        """Test that the loop idles and draws nothing while another process has the display."""
+        mock_clock = Mock()
+        mock_clock.tick.return_value = 16
+
+        mock_state_manager = Mock()
+        mock_state_manager.update.side_effect = lambda dt: setattr(self.game_loop, 'running', False)
+        mock_event_get.return_value = []
+
+        for owns_display in (True, False):
+            with self.subTest(owns_display=owns_display):
+                mock_state_manager.reset_mock()
+                mock_display_flip.reset_mock()
+                mock_clock.reset_mock()
+                mock_state_manager.owns_display.return_value = owns_display
+
+                self.game_loop.run(mock_state_manager, mock_clock, target_fps=60)
+
+                mock_state_manager.update.assert_called_once()
+                self.assertEqual(mock_state_manager.render.called, owns_display)
+                self.assertEqual(mock_display_flip.called, owns_display)
+                mock_clock.tick.assert_called_once_with(60 if owns_display else BACKGROUND_FPS)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,7 @@ from sbcman.services.game_utils import (
     create_game,
     game_to_dict,
     game_from_dict,
+    game_from_bytes,
     get_custom_resolution,
     get_custom_fps,
 )
@@ -339,5 +340,22 @@ class TestGameUtils(unittest.TestCase):
         self.assertEqual(result_data["custom_fps"], original_data["custom_fps"])
 
 
+    def test_roundtrip_binary(self):
+        """Test roundtrip through the protobuf binary wire format."""
+        game = create_game(
+            game_id="test20",
+            name="Test Game 20",
+            installed=True,
+            custom_input_mappings={"action": "space"},
+            custom_resolution=(1600, 900),
+            custom_fps=75,
+        )
+
+        result = game_from_bytes(game.SerializeToString())
+
+        self.assertEqual(result, game)
+        self.assertEqual(result.id, "test20")
+        self.assertEqual(get_custom_resolution(result), get_custom_resolution(game))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -10,10 +10,12 @@ Tests for layered input mapping system.
 import unittest
 import tempfile
 import json
+import os
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import shutil
 
+from sbcman.services import input_handler
 from sbcman.services.input_handler import InputHandler
 from sbcman.path.paths import AppPaths
 import pathlib
@@ -104,6 +106,82 @@ class TestInputHandler(unittest.TestCase):
         self.assertIsNotNone(self.handler.mappings)
         self.assertIn("confirm", self.handler.mappings)
 
+    @patch.dict("sbcman.services.input_handler._joystick_registry", clear=True)
+    @patch("pygame.joystick.Joystick")
+    @patch("pygame.joystick.get_count", return_value=2)
+    @patch("pygame.joystick.get_init", return_value=True)
+    @patch("pygame.joystick.init")
+    def test_joysticks_reused_across_handlers(self, mock_joystick_init, mock_get_init,
+                                              mock_get_count, mock_joystick_class):
+        """Test that joysticks are opened once and shared by later handlers."""
+        mock_joystick_class.side_effect = lambda index: Mock(name=f"joystick{index}")
+        
+        first = InputHandler(self.hw_config, self.handler.app_paths)
+        second = InputHandler(self.hw_config, self.handler.app_paths)
+        
+        self.assertEqual(mock_joystick_class.call_count, 2)
+        mock_joystick_init.assert_not_called()
+        self.assertEqual(len(first.joysticks), 2)
+        self.assertEqual(first.joysticks, second.joysticks)
+
+    @patch.dict("sbcman.services.input_handler._joystick_registry", clear=True)
+    @patch("pygame.joystick.Joystick")
+    @patch("pygame.joystick.get_count")
+    @patch("pygame.joystick.quit")
+    @patch("pygame.joystick.init")
+    def test_rescan_joysticks(self, mock_joystick_init, mock_joystick_quit,
+                              mock_get_count, mock_joystick_class):
+        """Test that a rescan reopens joysticks to pick up hotplugged devices."""
+        mock_joystick_class.side_effect = lambda index: Mock(name=f"joystick{index}")
+        mock_get_count.return_value = 1
+        InputHandler._open_joysticks()
+        
+        mock_get_count.return_value = 2
+        joysticks = InputHandler.rescan_joysticks()
+        
+        mock_joystick_quit.assert_called_once()
+        mock_joystick_init.assert_called_once()
+        self.assertEqual(len(joysticks), 2)
+        self.assertEqual(mock_joystick_class.call_count, 3)
+
+    @patch.dict("sbcman.services.input_handler._joystick_registry", clear=True)
+    @patch("pygame.joystick.Joystick")
+    @patch("pygame.joystick.get_count", return_value=1)
+    @patch("pygame.joystick.get_init", return_value=False)
+    @patch("pygame.joystick.init")
+    def test_joystick_reinit_clears_registry(self, mock_joystick_init, mock_get_init,
+                                             mock_get_count, mock_joystick_class):
+        """Test that joysticks from before a subsystem restart are not reused."""
+        stale = Mock(name="stale")
+        input_handler._joystick_registry[0] = stale
+        mock_joystick_class.side_effect = lambda index: Mock(name=f"joystick{index}")
+        
+        handler = InputHandler(self.hw_config, self.handler.app_paths)
+        
+        mock_joystick_init.assert_called()
+        mock_joystick_class.assert_called_once_with(0)
+        self.assertNotIn(stale, handler.joysticks)
+
+    @patch.dict("sbcman.services.input_handler._joystick_registry", clear=True)
+    @patch("pygame.joystick.Joystick")
+    @patch("pygame.joystick.get_count", return_value=2)
+    def test_open_joysticks_replaces_invalid(self, mock_get_count, mock_joystick_class):
+        """Test that registered joysticks which are no longer initialized are reopened."""
+        import pygame
+        
+        valid = Mock(name="valid")
+        valid.get_init.return_value = True
+        invalid = Mock(name="invalid")
+        invalid.get_init.side_effect = pygame.error("Joystick not initialized")
+        input_handler._joystick_registry.update({0: valid, 1: invalid})
+        mock_joystick_class.side_effect = lambda index: Mock(name=f"joystick{index}")
+        
+        joysticks = InputHandler._open_joysticks()
+        
+        mock_joystick_class.assert_called_once_with(1)
+        self.assertIs(joysticks[0], valid)
+        self.assertIsNot(joysticks[1], invalid)
+
     def test_get_button_names(self):
         # Test button 0 (A button)
         names = self.handler._get_button_names(0)
@@ -114,6 +192,14 @@ class TestInputHandler(unittest.TestCase):
         # Test button 7 (Start button)
         names = self.handler._get_button_names(7)
         self.assertIn("BUTTON_START", names)
+        
+        # Test buttons outside the precomputed table
+        self.assertEqual(self.handler._get_button_names(15), ("BUTTON_15",))
+        self.assertEqual(self.handler._get_button_names(20), ("BUTTON_20",))
+        
+        # Repeated lookups do not grow the shared table entries
+        self.assertEqual(self.handler._get_button_names(0), self.handler._get_button_names(0))
+        self.assertEqual(len(self.handler._get_button_names(0)), 3)
 
     @patch("pygame.joystick.get_count")
     @patch("pygame.joystick.init")
@@ -154,10 +240,8 @@ class TestInputHandler(unittest.TestCase):
         # and is not overridden by device mapping
         self.assertIn("cancel", self.handler.mappings)
         
-        # Mock keyboard event for ESCAPE key
-        event = Mock()
-        event.type = pygame.KEYDOWN
-        event.key = pygame.K_ESCAPE
+        # Keyboard event for ESCAPE key
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
         
         result = self.handler.is_action_pressed("cancel", [event])
         
@@ -175,10 +259,8 @@ class TestInputHandler(unittest.TestCase):
         # Load mapping hierarchy (already configured in setUp)
         self.handler._load_mapping_hierarchy()
         
-        # Mock joystick button event (button 0 = A button)
-        event = Mock()
-        event.type = pygame.JOYBUTTONDOWN
-        event.button = 0
+        # Joystick button event (button 0 = A button)
+        event = pygame.event.Event(pygame.JOYBUTTONDOWN, button=0)
         
         result = self.handler.is_action_pressed("confirm", [event])
         
@@ -203,3 +285,187 @@ class TestInputHandler(unittest.TestCase):
             saved_mapping = json.load(f)
         
         self.assertEqual(saved_mapping["confirm"], ["BUTTON_X", "SPACE"])
+
+    def test_save_mapping_fsyncs_file_and_directory(self):
+        """Test that a saved mapping is flushed to disk before and after the rename."""
+        disk = Mock()
+        disk.fsync.side_effect = os.fsync
+        disk.replace.side_effect = os.replace
+        with patch.multiple("sbcman.services.input_handler.os", fsync=disk.fsync, replace=disk.replace):
+            self.handler.save_mapping("confirm", ["BUTTON_X"], scope="device")
+        
+        # The temp file is flushed before the rename, the directory after it
+        self.assertEqual([name for name, _, _ in disk.mock_calls], ["fsync", "replace", "fsync"])
+        device_mapping_file = self.handler.app_paths.input_overrides / "device.json"
+        self.assertEqual(json.loads(device_mapping_file.read_text())["confirm"], ["BUTTON_X"])
+        self.assertFalse(device_mapping_file.with_suffix(".json.tmp").exists())
+
+    def test_save_mapping_directory_fsync_failure(self):
+        """Test that a failed directory flush is a warning, not a failed save."""
+        with patch.object(InputHandler, "_fsync_directory", side_effect=OSError("not supported")):
+            with self.assertLogs(input_handler.logger, level="WARNING") as logs:
+                self.handler.save_mapping("confirm", ["BUTTON_X"], scope="device")
+        
+        self.assertEqual([record.levelname for record in logs.records], ["WARNING"])
+        self.assertNotIn("Failed to save mapping", logs.output[0])
+        device_mapping_file = self.handler.app_paths.input_overrides / "device.json"
+        self.assertEqual(json.loads(device_mapping_file.read_text())["confirm"], ["BUTTON_X"])
+        self.assertIn("device.json", self.handler._override_files)
+
+    @patch("pygame.joystick.get_count")
+    @patch("pygame.joystick.init")
+    def test_is_action_pressed_after_save_mapping(self, mock_joystick_init, mock_get_count):
+        """Test that saved mappings are used for action detection."""
+        import pygame
+        
+        mock_get_count.return_value = 0
+        
+        event = pygame.event.Event(pygame.JOYBUTTONDOWN, button=2)
+        
+        self.assertFalse(self.handler.is_action_pressed("confirm", [event]))
+        
+        self.handler.save_mapping("confirm", ["BUTTON_X"], scope="device")
+        
+        self.assertTrue(self.handler.is_action_pressed("confirm", [event]))
+
+    def test_is_action_pressed_unknown_action(self):
+        """Test that unmapped actions are never triggered."""
+        import pygame
+        
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN)
+        
+        self.assertFalse(self.handler.is_action_pressed("unknown", [event]))
+
+    def test_actions_pressed_single_pass(self):
+        """Test that all triggered actions are collected from one event list."""
+        import pygame
+        
+        button_event = pygame.event.Event(pygame.JOYBUTTONDOWN, button=0)
+        hat_event = pygame.event.Event(pygame.JOYHATMOTION, value=(0, -1))
+        key_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+        
+        pressed = self.handler.actions_pressed([button_event, hat_event, key_event])
+        
+        self.assertEqual(pressed, {"confirm", "down", "cancel"})
+        for action in ("confirm", "down", "cancel", "up"):
+            self.assertEqual(
+                action in pressed,
+                self.handler.is_action_pressed(action, [button_event, hat_event, key_event]),
+            )
+
+    def test_event_actions_resolved_from_mappings(self):
+        """Test that key names and button names resolve to event codes once."""
+        import pygame
+        
+        self.handler.save_mapping("menu", ["BUTTON_MENU", "BUTTON_20", "M"], scope="device")
+        
+        for button in (12, 13, 20):
+            event = pygame.event.Event(pygame.JOYBUTTONDOWN, button=button)
+            self.assertTrue(self.handler.is_action_pressed("menu", [event]))
+        
+        key_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_m)
+        self.assertEqual(self.handler.actions_pressed([key_event]), {"menu"})
+        
+        other_key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_n)
+        self.assertEqual(self.handler.actions_pressed([other_key]), set())
+
+    def test_actions_pressed_no_input_events(self):
+        """Test that non-input events trigger no actions."""
+        import pygame
+        
+        event = pygame.event.Event(pygame.MOUSEMOTION)
+        
+        self.assertEqual(self.handler.actions_pressed([]), set())
+        self.assertEqual(self.handler.actions_pressed([event]), set())
+
+    def test_load_mapping_hierarchy_skips_absent_files(self):
+        """Test that mapping files missing from the scan are not opened."""
+        with patch.object(self.handler, "_load_mapping_file", return_value={}) as mock_load:
+            self.handler.set_game_context("test-game")
+        
+        loaded = [call.args[0].name for call in mock_load.call_args_list]
+        self.assertEqual(loaded, ["default.json", "anbernic.json"])
+
+    def test_reload_picks_up_new_files(self):
+        """Test that reload rescans the mapping directories."""
+        game_file = self.handler.app_paths.input_overrides / "games" / "test-game.json"
+        game_file.write_text(json.dumps({"jump": ["BUTTON_Y"]}))
+        
+        self.handler.set_game_context("test-game")
+        self.assertNotIn("jump", self.handler.mappings)
+        
+        self.handler.reload()
+        self.assertEqual(self.handler.mappings["jump"], ["BUTTON_Y"])
+
+    def test_save_mapping_game_scope_reloads(self):
+        """Test that a saved per-game mapping is loaded on the next context switch."""
+        self.handler.set_game_context("test-game")
+        self.handler.save_mapping("jump", ["BUTTON_Y"], scope="game")
+        
+        self.handler.clear_game_context()
+        self.assertNotIn("jump", self.handler.mappings)
+        
+        self.handler.set_game_context("test-game")
+        self.assertEqual(self.handler.mappings["jump"], ["BUTTON_Y"])
+
+    def test_load_mapping_file_missing(self):
+        """Test loading a mapping file that doesn't exist."""
+        missing = Path(self.temp_dir) / "missing.json"
+        
+        self.assertEqual(self.handler._load_mapping_file(missing), {})
+
+    def test_load_mapping_file_invalid_json(self):
+        """Test loading a mapping file with invalid JSON."""
+        invalid = Path(self.temp_dir) / "invalid.json"
+        invalid.write_text("{not json")
+        
+        self.assertEqual(self.handler._load_mapping_file(invalid), {})
+
+    def test_set_game_context_uses_cache(self):
+        """Test that returning to a seen game context does not reload files."""
+        self.handler.set_game_context("test-game")
+        self.handler.clear_game_context()
+        
+        with patch.object(self.handler, "_load_mapping_file") as mock_load:
+            self.handler.set_game_context("test-game")
+            self.handler.clear_game_context()
+        
+        mock_load.assert_not_called()
+        self.assertEqual(self.handler.mappings["confirm"], ["BUTTON_SOUTH"])
+
+    def test_mapping_cache_is_bounded(self):
+        """Test that the merged mapping cache evicts the oldest entries."""
+        from sbcman.services.input_handler import MAPPING_CACHE_SIZE
+        
+        for i in range(MAPPING_CACHE_SIZE + 5):
+            self.handler.set_game_context(f"game-{i}")
+        
+        self.assertEqual(len(self.handler._merged_cache), MAPPING_CACHE_SIZE)
+        self.assertNotIn(("anbernic", None), self.handler._merged_cache)
+        self.assertIn(("anbernic", f"game-{MAPPING_CACHE_SIZE + 4}"), self.handler._merged_cache)
+
+    def test_save_mapping_device_scope_invalidates_cache(self):
+        """Test that a device-wide save is visible in every game context."""
+        self.handler.set_game_context("test-game")
+        self.handler.clear_game_context()
+        
+        self.handler.save_mapping("jump", ["BUTTON_Y"], scope="device")
+        
+        self.handler.set_game_context("test-game")
+        self.assertEqual(self.handler.mappings["jump"], ["BUTTON_Y"])
+
+    def test_save_mapping_keeps_existing_entries(self):
+        """Test that saving merges into existing overrides without re-reading the file."""
+        self.handler.save_mapping("confirm", ["BUTTON_X"], scope="device")
+        
+        with patch.object(self.handler, "_load_mapping_file") as mock_load:
+            self.handler.save_mapping("cancel", ["BUTTON_Y"], scope="device")
+        
+        mock_load.assert_not_called()
+        
+        overrides_dir = self.handler.app_paths.input_overrides
+        with open(overrides_dir / "device.json", "r") as f:
+            saved_mapping = json.load(f)
+        
+        self.assertEqual(saved_mapping, {"confirm": ["BUTTON_X"], "cancel": ["BUTTON_Y"]})
+        self.assertFalse((overrides_dir / "device.json.tmp").exists())
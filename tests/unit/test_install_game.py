@@ -133,11 +133,9 @@ class TestGameInstaller(unittest.TestCase):
             wheel_path = Path(temp_dir) / "test-game.whl"
             wheel_path.write_text("wheel content")
 
-            with self.assertRaises(Exception) as context:
+            with self.assertRaisesRegex(Exception, "Wheel installation failed"):
                 installer.install_game(wheel_path, game)
 
-            self.assertIn("Wheel installation failed", str(context.exception))
-
     def test_get_portmaster_image_dir_with_config(self):
         """Test getting portmaster image directory with config."""
         config = Mock()
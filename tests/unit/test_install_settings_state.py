@@ -17,8 +17,15 @@ from sbcman.states.install_settings_state import InstallSettingsState
 
 class TestInstallSettingsState(unittest.TestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
         self.mock_state_manager = Mock()
         self.install_settings_state = InstallSettingsState(self.mock_state_manager)
         self.hw_config = {
@@ -39,9 +46,6 @@ class TestInstallSettingsState(unittest.TestCase):
         ]
         self.install_settings_state.config = self.mock_config_manager
     
-    def tearDown(self):
-        pygame.quit()
-    
     def test_install_settings_state_initialization(self):
         self.install_settings_state.on_enter(None)
         self.assertIsNotNone(getattr(self.install_settings_state, 'settings_list', None))
@@ -81,7 +85,7 @@ class TestInstallSettingsState(unittest.TestCase):
             False,
         ]
         
-        mock_events = [Mock()]
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
         
         with patch.object(self.install_settings_state, '_handle_exit_input', return_value=False):
             self.install_settings_state.handle_events(mock_events)
@@ -13,31 +13,11 @@ import zipfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from sbcman.services.download_manager import DownloadManager, DownloadObserver
+from sbcman.services.download_manager import DownloadManager
 from sbcman.services.install_game import GameInstaller
 from sbcman.proto import game_pb2
 from sbcman.path.paths import AppPaths
-
-
-class TestInstallationProgressObserver(DownloadObserver):
-    """Test implementation of DownloadObserver for testing progress tracking."""
-    
-    def __init__(self):
-        self.progress_calls = []
-        self.complete_calls = []
-        self.error_calls = []
-    
-    def on_progress(self, downloaded: int, total: int) -> None:
-        """Track progress calls."""
-        self.progress_calls.append((downloaded, total))
-    
-    def on_complete(self, success: bool, message: str) -> None:
-        """Track complete calls."""
-        self.complete_calls.append((success, message))
-    
-    def on_error(self, error_message: str) -> None:
-        """Track error calls."""
-        self.error_calls.append(error_message)
+from tests.test_utils import RecordingDownloadObserver
 
 
 class TestInstallationProgress(unittest.TestCase):
@@ -65,7 +45,7 @@ class TestInstallationProgress(unittest.TestCase):
     
     def test_download_progress_scaling(self):
         """Test that download progress is scaled to 0-60% range."""
-        observer = TestInstallationProgressObserver()
+        observer = RecordingDownloadObserver()
         
         # Simulate download progress callback
         def progress_callback(downloaded: int, total: int) -> None:
@@ -185,7 +165,7 @@ class TestInstallationProgress(unittest.TestCase):
     
     def test_unified_progress_flow(self):
         """Test the complete unified progress flow from download to install."""
-        observer = TestInstallationProgressObserver()
+        observer = RecordingDownloadObserver()
         
         # Simulate download phase (0-60%)
         download_progress_values = []
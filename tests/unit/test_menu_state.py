@@ -19,8 +19,17 @@ from sbcman.states.menu_state import MenuState
 
 class TestMenuState(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        # Exiting the menu posts QUIT; pygame stays initialized between tests
+        pygame.event.clear()
         self.mock_state_manager = Mock()
         self.menu_state = MenuState(self.mock_state_manager)
         self.hw_config = {
@@ -32,9 +41,6 @@ class TestMenuState(unittest.TestCase):
         self.mock_input_handler = Mock()
         self.menu_state.input_handler = self.mock_input_handler
 
-    def tearDown(self):
-        pygame.quit()
-
     def test_menu_state_initialization(self):
         self.menu_state.on_enter(None)
         self.assertEqual(self.menu_state.selected_option, 0)
@@ -53,7 +59,7 @@ class TestMenuState(unittest.TestCase):
         self.menu_state.on_enter(None)
         self.menu_state.selected_option = 0
 
-        mock_events = [Mock()]
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
 
         with patch.object(self.menu_state, '_handle_exit_input', return_value=False):
             self.mock_input_handler.is_action_pressed.side_effect = lambda action, events: {
@@ -70,7 +76,7 @@ class TestMenuState(unittest.TestCase):
         self.menu_state.on_enter(None)
         self.menu_state.selected_option = 1
 
-        mock_events = [Mock()]
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
 
         with patch.object(self.menu_state, '_handle_exit_input', return_value=False):
             self.mock_input_handler.is_action_pressed.side_effect = lambda action, events: {
@@ -100,7 +106,7 @@ class TestMenuState(unittest.TestCase):
 
                 self.menu_state.selected_option = selected_option
 
-                mock_events = [Mock()]
+                mock_events = [pygame.event.Event(pygame.USEREVENT)]
 
                 with patch.object(self.menu_state, '_handle_exit_input', return_value=False):
                     self.mock_input_handler.is_action_pressed.side_effect = lambda action, events: {
@@ -8,6 +8,7 @@ Tests for application paths management and directory creation.
 """
 
 import unittest
+from unittest.mock import patch
 from pathlib import Path
 import tempfile
 import shutil
@@ -39,6 +40,18 @@ class TestAppPaths(unittest.TestCase):
         self.assertEqual(app_paths.config_dir, Path(".") / "config")
         self.assertEqual(app_paths.data_dir, Path(".") / "data")
 
+    def test_temp_dir_created_on_first_use(self):
+        """Test that the temp directory is only created when first accessed."""
+        with patch("tempfile.mkdtemp", return_value=str(self.temp_dir)) as mock_mkdtemp:
+            app_paths = AppPaths(self.temp_dir, self.temp_dir)
+            mock_mkdtemp.assert_not_called()
+            
+            temp_dir = app_paths.temp_dir
+            
+            self.assertTrue(temp_dir.is_dir())
+            self.assertEqual(app_paths.temp_dir, temp_dir)
+            mock_mkdtemp.assert_called_once()
+
     def test_app_paths_custom_initialization(self):
         """Test AppPaths initialization with custom paths."""
         custom_base = self.temp_dir / "base"
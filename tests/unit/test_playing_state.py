@@ -19,8 +19,15 @@ from sbcman.states.playing_state import PlayingState
 
 class TestPlayingState(unittest.TestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
         self.mock_state_manager = Mock()
         self.playing_state = PlayingState(self.mock_state_manager)
         self.hw_config = {
@@ -36,9 +43,6 @@ class TestPlayingState(unittest.TestCase):
         self.mock_input_handler = Mock()
         self.playing_state.input_handler = self.mock_input_handler
     
-    def tearDown(self):
-        pygame.quit()
-    
     def test_playing_state_initialization(self):
         self.playing_state.on_enter(None)
         self.assertTrue(self.playing_state.game_running)
@@ -71,7 +75,7 @@ class TestPlayingState(unittest.TestCase):
             False,
         ]
         
-        mock_events = [Mock()]
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
         
         with patch.object(self.playing_state, '_handle_exit_input', return_value=False):
             self.playing_state.handle_events(mock_events)
@@ -93,4 +97,83 @@ class TestPlayingState(unittest.TestCase):
             self.playing_state.render(mock_surface)
             
             mock_surface.fill.assert_called_once_with((20, 20, 30))
-            self.assertTrue(mock_font.render.called)
\ No newline at end of file
+            self.assertTrue(mock_font.render.called)
+
+    @patch('sbcman.states.playing_state.process_launcher.ProcessLauncher')
+    def test_playing_state_game_started_without_blocking(self, mock_launcher_class):
+        mock_launcher = mock_launcher_class.return_value
+        mock_process = Mock()
+        mock_launcher.is_running.return_value = True
+        mock_launcher.start_game_subprocess.return_value = mock_process
+        
+        self.playing_state.on_enter(None)
+        
+        # The game runs as a subprocess, not through the blocking launch_game
+        mock_launcher.start_game_subprocess.assert_called_once_with(
+            self.mock_state_manager.selected_game)
+        mock_launcher.launch_game.assert_not_called()
+        
+        self.assertTrue(self.playing_state.game_running)
+        self.assertIs(self.playing_state.game_process, mock_process)
+        mock_process.wait.assert_not_called()
+        
+        # Still running: stay in the playing state
+        self.playing_state.update(0.016)
+        mock_launcher.is_running.assert_called_with(mock_process)
+        self.mock_state_manager.change_state.assert_not_called()
+        
+        # Exited: report once and return to the game list
+        mock_launcher.is_running.return_value = False
+        self.playing_state.update(0.016)
+        mock_launcher.finish_game_subprocess.assert_called_once_with(
+            self.mock_state_manager.selected_game, mock_process)
+        self.mock_state_manager.change_state.assert_called_once_with("game_list")
+        
+        self.playing_state.on_exit()
+        mock_launcher.finish_game_subprocess.assert_called_once()
+        mock_launcher.terminate.assert_not_called()
+    
+    @patch('sbcman.states.playing_state.process_launcher.ProcessLauncher')
+    def test_playing_state_on_exit_terminates_running_game(self, mock_launcher_class):
+        mock_launcher = mock_launcher_class.return_value
+        mock_process = Mock()
+        mock_launcher.is_running.return_value = True
+        mock_launcher.start_game_subprocess.return_value = mock_process
+        
+        self.playing_state.on_enter(None)
+        self.playing_state.on_exit()
+        
+        mock_launcher.terminate.assert_called_once_with(mock_process)
+        mock_launcher.finish_game_subprocess.assert_called_once()
+        self.assertFalse(self.playing_state.game_running)
+    
+    @patch('sbcman.states.playing_state.process_launcher.ProcessLauncher')
+    def test_playing_state_releases_input_and_display_while_game_runs(self, mock_launcher_class):
+        mock_launcher = mock_launcher_class.return_value
+        mock_process = Mock()
+        mock_launcher.is_running.return_value = True
+        mock_launcher.start_game_subprocess.return_value = mock_process
+        
+        self.playing_state.on_enter(None)
+        self.assertFalse(self.playing_state.owns_display())
+        
+        # Cancel and ESC presses belong to the game
+        self.mock_input_handler.is_action_pressed.return_value = True
+        self.playing_state.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)])
+        
+        self.mock_state_manager.change_state.assert_not_called()
+        mock_launcher.terminate.assert_not_called()
+        
+        # The launcher takes the display back once the game has exited
+        mock_launcher.is_running.return_value = False
+        self.playing_state.update(0.016)
+        self.assertTrue(self.playing_state.owns_display())
+    
+    @patch('sbcman.states.playing_state.process_launcher.ProcessLauncher')
+    def test_playing_state_launch_failure(self, mock_launcher_class):
+        mock_launcher_class.return_value.start_game_subprocess.return_value = None
+        
+        self.playing_state.on_enter(None)
+        
+        self.assertFalse(self.playing_state.game_running)
+        self.assertTrue(self.playing_state.message.startswith("Error launching game"))
@@ -142,6 +142,35 @@ class TestProcessLauncher(unittest.TestCase):
         # Verify Popen was not called
         mock_popen.assert_not_called()
 
+    def test_build_environment(self):
+        """Test environment built for a game with resolution and FPS overrides."""
+        game = Mock()
+        game.HasField.return_value = True
+        game.custom_resolution.width = 1920
+        game.custom_resolution.height = 1080
+        game.custom_fps = 30
+        
+        env = self.launcher._build_environment(game)
+        
+        self.assertEqual(env["GAME_RESOLUTION"], "1920x1080")
+        self.assertEqual(env["GAME_FPS"], "30")
+        self.assertEqual(env["DEVICE_TYPE"], "test_device")
+        self.assertEqual(env["OS_TYPE"], "test_os")
+
+    @patch.dict('os.environ', {'SBC_TEST_VAR': 'inherited'})
+    def test_build_environment_without_overrides(self):
+        """Test environment for a game without overrides keeps the parent environment."""
+        game = Mock()
+        game.HasField.return_value = False
+        game.custom_fps = 0
+        
+        env = self.launcher._build_environment(game)
+        
+        self.assertEqual(env["SBC_TEST_VAR"], "inherited")
+        self.assertNotIn("GAME_RESOLUTION", env)
+        self.assertNotIn("GAME_FPS", env)
+        self.assertEqual(env["DEVICE_TYPE"], "test_device")
+
     @patch('subprocess.Popen')
     @patch('os.path.exists')
     def test_launch_game_with_custom_resolution(self, mock_exists, mock_popen):
@@ -264,6 +293,76 @@ class TestProcessLauncher(unittest.TestCase):
         #self.assertIn('OS_TYPE', captured_env)
         #self.assertEqual(captured_env['OS_TYPE'], 'test_os')
 
+    def _create_installed_game(self, install_dir):
+        """Create an installed game with an entry point in install_dir."""
+        (Path(install_dir) / "main.py").write_text("print('game')")
+        game = game_pb2.Game()
+        game.id = "subprocess-game"
+        game.name = "Subprocess Game"
+        game.installed = True
+        game.install_path = str(install_dir)
+        game.entry_point = "main.py"
+        return game
+
+    @patch.object(ProcessLauncher, '_build_environment', return_value={})
+    @patch('subprocess.Popen')
+    def test_start_game_subprocess_does_not_wait(self, mock_popen, mock_build_environment):
+        """Test that starting a game returns the process without waiting for it."""
+        with tempfile.TemporaryDirectory() as tmp:
+            game = self._create_installed_game(Path(tmp))
+            
+            process = self.launcher.start_game_subprocess(game)
+            
+            self.assertIs(process, mock_popen.return_value)
+            mock_popen.return_value.wait.assert_not_called()
+            
+            process.returncode = 0
+            self.assertTrue(self.launcher.finish_game_subprocess(game, process))
+            process.returncode = 1
+            self.assertFalse(self.launcher.finish_game_subprocess(game, process))
+
+    @patch.object(ProcessLauncher, '_build_environment', return_value={})
+    @patch('subprocess.Popen')
+    def test_launch_game_subprocess_discards_output(self, mock_popen, mock_build_environment):
+        """Test game output is discarded instead of buffered by default."""
+        mock_process = Mock()
+        mock_process.returncode = 0
+        mock_popen.return_value = mock_process
+        
+        with tempfile.TemporaryDirectory() as install_dir:
+            game = self._create_installed_game(install_dir)
+            result = self.launcher.launch_game_subprocess(game)
+            self.assertFalse((Path(install_dir) / "game_output.log").exists())
+        
+        self.assertTrue(result)
+        args = mock_popen.call_args[0][0]
+        self.assertTrue(Path(args[0]).is_absolute())
+        kwargs = mock_popen.call_args[1]
+        self.assertNotIn('preexec_fn', kwargs)
+        self.assertNotIn('start_new_session', kwargs)
+        self.assertEqual(kwargs['stdout'], subprocess.DEVNULL)
+        self.assertEqual(kwargs['stderr'], subprocess.STDOUT)
+        mock_process.wait.assert_called_once()
+        mock_process.communicate.assert_not_called()
+
+    @patch.object(ProcessLauncher, '_build_environment', return_value={})
+    @patch('subprocess.Popen')
+    def test_launch_game_subprocess_captures_output_to_file(self, mock_popen, mock_build_environment):
+        """Test game output is written to a log file when capture is enabled."""
+        mock_process = Mock()
+        mock_process.returncode = 1
+        mock_popen.return_value = mock_process
+        launcher = ProcessLauncher(dict(self.hw_config, capture_game_output=True))
+        
+        with tempfile.TemporaryDirectory() as install_dir:
+            game = self._create_installed_game(install_dir)
+            result = launcher.launch_game_subprocess(game)
+            self.assertTrue((Path(install_dir) / "game_output.log").exists())
+        
+        self.assertFalse(result)
+        stdout = mock_popen.call_args[1]['stdout']
+        self.assertTrue(stdout.closed)
+
     @patch('subprocess.run')
     def disabled_test_run_pre_commands_success(self, mock_run):
         """Test successful execution of pre-launch commands."""
@@ -16,13 +16,17 @@ from sbcman.views.widgets.progress_bar import ProgressBar
 
 class TestProgressBar(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         pygame.init()
-        self.progress_bar = ProgressBar(x=100, y=100, width=400, height=30)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         pygame.quit()
 
+    def setUp(self):
+        self.progress_bar = ProgressBar(x=100, y=100, width=400, height=30)
+
     def test_initialization_default(self):
         progress_bar = ProgressBar(x=50, y=50, width=200)
         self.assertEqual(progress_bar.x, 50)
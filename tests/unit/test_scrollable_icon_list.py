@@ -16,16 +16,20 @@ from sbcman.views.widgets.scrollable_icon_list import ScrollableIconList
 
 class TestScrollableIconList(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
         self.list_widget = ScrollableIconList(
             x=10, y=20, width=300, height=200,
             item_height=60, font_size=24, padding=10, icon_size=40
         )
 
-    def tearDown(self):
-        pygame.quit()
-
     def test_initialization(self):
         widget = ScrollableIconList(
             x=10, y=20, width=300, height=200,
@@ -349,5 +349,45 @@ class TestScrollableList(unittest.TestCase):
         self.assertFalse(result)
 
 
+    def test_render_reuses_item_surfaces(self):
+        """Test that item text is rendered once and reused on later frames."""
+        self.list_widget.set_items(["Item 1", "Item 2"])
+        surface = pygame.Surface((300, 200))
+        
+        with patch.object(self.list_widget, '_truncate_text', wraps=self.list_widget._truncate_text) as mock_truncate:
+            self.list_widget.render(surface)
+            self.list_widget.render(surface)
+        
+        self.assertEqual(mock_truncate.call_count, 2)
+
+    def test_render_only_visible_items(self):
+        """Test that rendering cost depends on the visible rows, not the item count."""
+        self.list_widget.set_items([f"Item {i}" for i in range(200)])
+        for _ in range(50):
+            self.list_widget.scroll_down()
+        surface = pygame.Surface((300, 200))
+        
+        with patch.object(self.list_widget, '_render_item_text',
+                          wraps=self.list_widget._render_item_text) as mock_render_item:
+            self.list_widget.render(surface)
+        
+        visible = self.list_widget.visible_items_count
+        self.assertEqual(mock_render_item.call_count, visible)
+        rendered = [call.args[0] for call in mock_render_item.call_args_list]
+        offset = self.list_widget.scroll_offset
+        self.assertEqual(rendered, [f"Item {i}" for i in range(offset, offset + visible)])
+        self.assertIn("Item 50", rendered)
+
+    def test_set_items_clears_item_surfaces(self):
+        """Test that new items are rendered fresh."""
+        self.list_widget.set_items(["Item 1"])
+        self.list_widget.render(pygame.Surface((300, 200)))
+        self.assertTrue(self.list_widget._item_surfaces)
+        
+        self.list_widget.set_items(["Other"])
+        
+        self.assertEqual(self.list_widget._item_surfaces, {})
+
+
 if __name__ == '__main__':
     unittest.main()
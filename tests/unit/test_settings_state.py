@@ -19,8 +19,15 @@ from sbcman.states.settings_state import SettingsState
 
 class TestSettingsState(unittest.TestCase):
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
         self.mock_state_manager = Mock()
         self.settings_state = SettingsState(self.mock_state_manager)
         self.hw_config = {
@@ -35,9 +42,6 @@ class TestSettingsState(unittest.TestCase):
         self.mock_config_manager = Mock()
         self.settings_state.config = self.mock_config_manager
     
-    def tearDown(self):
-        pygame.quit()
-    
     def test_settings_state_initialization(self):
         self.settings_state.on_enter(None)
         self.assertIsNotNone(getattr(self.settings_state, 'settings_list', None))
@@ -64,7 +68,7 @@ class TestSettingsState(unittest.TestCase):
             False,
         ]
         
-        mock_events = [Mock()]
+        mock_events = [pygame.event.Event(pygame.USEREVENT)]
         
         with patch.object(self.settings_state, '_handle_exit_input', return_value=False):
             self.settings_state.handle_events(mock_events)
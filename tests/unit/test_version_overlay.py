@@ -16,13 +16,17 @@ from sbcman.views.widgets.version_overlay import VersionOverlay
 
 class TestVersionOverlay(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         pygame.init()
-        self.overlay = VersionOverlay()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         pygame.quit()
 
+    def setUp(self):
+        self.overlay = VersionOverlay()
+
     def test_initialization_default(self):
         overlay = VersionOverlay()
         self.assertEqual(overlay.font_size, 16)